@@ -73,9 +73,16 @@ class Command(BaseCommand):
             {'username': 'prof_martinez', 'email': 'martinez@richwell.edu', 'first_name': 'Linda', 'last_name': 'Martinez'},
         ]
 
+        # Look up the usernames that already exist in one query
+        existing = set(
+            User.objects.filter(
+                username__in=[prof['username'] for prof in professors]
+            ).values_list('username', flat=True)
+        )
+
         created = 0
         for prof in professors:
-            if not User.objects.filter(username=prof['username']).exists():
+            if prof['username'] not in existing:
                 User.objects.create_user(
                     username=prof['username'],
                     email=prof['email'],
@@ -90,9 +90,16 @@ class Command(BaseCommand):
             },
         ]
 
+        # Look up the usernames that already exist in one query
+        existing = set(
+            User.objects.filter(
+                username__in=[prof_data['username'] for prof_data in professors]
+            ).values_list('username', flat=True)
+        )
+
         created_count = 0
         for prof_data in professors:
-            if not User.objects.filter(username=prof_data['username']).exists():
+            if prof_data['username'] not in existing:
                 user = User.objects.create_user(
                     username=prof_data['username'],
                     email=prof_data['email'],
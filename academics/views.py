@@ -4,7 +4,8 @@ from django.contrib import messages
 from django.db import transaction
 from django.db.models import Q
 from users.decorators import role_required
-from audit.models import AuditTrail
+from audit.utils import record_audit
+from enrollment.cache_utils import prereq_map_for_curriculum
 from .models import Program, Curriculum, Subject, Prereq, CurriculumSubject
 import json
 
@@ -49,7 +50,7 @@ def program_create(request):
             )
 
             # Audit trail
-            AuditTrail.objects.create(
+            record_audit(
                 actor=request.user,
                 action='create',
                 entity='Program',
@@ -96,7 +97,7 @@ def program_update(request, pk):
             program.save()
 
             # Audit trail
-            AuditTrail.objects.create(
+            record_audit(
                 actor=request.user,
                 action='update',
                 entity='Program',
@@ -142,7 +143,7 @@ def program_delete(request, pk):
             }
 
             # Audit trail before deletion
-            AuditTrail.objects.create(
+            record_audit(
                 actor=request.user,
                 action='delete',
                 entity='Program',
@@ -218,7 +219,7 @@ def program_subject_archive(request, program_pk, subject_pk):
             subject.save()
 
             # Audit trail
-            AuditTrail.objects.create(
+            record_audit(
                 actor=request.user,
                 action='archive',
                 entity='Subject',
@@ -277,7 +278,7 @@ def curriculum_create(request):
             )
 
             # Audit trail
-            AuditTrail.objects.create(
+            record_audit(
                 actor=request.user,
                 action='create',
                 entity='Curriculum',
@@ -406,7 +407,7 @@ def curriculum_add_subjects(request, pk):
                     added_count += 1
 
             # Audit trail
-            AuditTrail.objects.create(
+            record_audit(
                 actor=request.user,
                 action='add_subjects',
                 entity='Curriculum',
@@ -452,7 +453,7 @@ def curriculum_remove_subject(request, curriculum_pk, subject_pk):
             subject_title = curriculum_subject.subject.title
 
             # Audit trail before deletion
-            AuditTrail.objects.create(
+            record_audit(
                 actor=request.user,
                 action='remove_subject',
                 entity='Curriculum',
@@ -499,7 +500,7 @@ def curriculum_edit_subject(request, curriculum_pk, subject_pk):
             curriculum_subject.save()
 
             # Audit trail
-            AuditTrail.objects.create(
+            record_audit(
                 actor=request.user,
                 action='update_subject_placement',
                 entity='Curriculum',
@@ -552,7 +553,7 @@ def curriculum_update(request, pk):
             curriculum.save()
 
             # Audit trail
-            AuditTrail.objects.create(
+            record_audit(
                 actor=request.user,
                 action='update',
                 entity='Curriculum',
@@ -611,19 +612,23 @@ def curriculum_duplicate(request, pk):
                     active=False
                 )
 
-                # Copy all curriculum subjects
+                # Copy all curriculum subjects in a single INSERT
                 source_subjects = CurriculumSubject.objects.filter(curriculum=source_curriculum)
-                for cs in source_subjects:
-                    CurriculumSubject.objects.create(
+                copied = CurriculumSubject.objects.bulk_create([
+                    CurriculumSubject(
                         curriculum=new_curriculum,
-                        subject=cs.subject,
+                        subject_id=cs.subject_id,
                         year_level=cs.year_level,
                         term_no=cs.term_no,
                         is_recommended=cs.is_recommended
                     )
+                    for cs in source_subjects
+                ])
+                # bulk_create fires no CurriculumSubject signals
+                transaction.on_commit(prereq_map_for_curriculum.cache_clear)
 
                 # Audit trail
-                AuditTrail.objects.create(
+                record_audit(
                     actor=request.user,
                     action='duplicate',
                     entity='Curriculum',
@@ -632,7 +637,7 @@ def curriculum_duplicate(request, pk):
                     new_value_json={
                         'version': new_version,
                         'effective_sy': new_effective_sy,
-                        'subjects_copied': source_subjects.count()
+                        'subjects_copied': len(copied)
                     }
                 )
 
@@ -674,7 +679,7 @@ def curriculum_toggle_active(request, pk):
                 curriculum.save()
 
                 # Audit trail
-                AuditTrail.objects.create(
+                record_audit(
                     actor=request.user,
                     action='toggle_active',
                     entity='Curriculum',
@@ -760,7 +765,7 @@ def subject_create(request):
                         )
 
                 # Audit trail
-                AuditTrail.objects.create(
+                record_audit(
                     actor=request.user,
                     action='create',
                     entity='Subject',
@@ -837,7 +842,7 @@ def subject_update(request, pk):
                         )
 
                 # Audit trail
-                AuditTrail.objects.create(
+                record_audit(
                     actor=request.user,
                     action='update',
                     entity='Subject',
@@ -885,7 +890,7 @@ def subject_delete(request, pk):
             }
 
             # Audit trail before deletion
-            AuditTrail.objects.create(
+            record_audit(
                 actor=request.user,
                 action='delete',
                 entity='Subject',
@@ -993,7 +998,7 @@ def prerequisite_add(request):
             )
 
             # Audit trail
-            AuditTrail.objects.create(
+            record_audit(
                 actor=request.user,
                 action='add_prerequisite',
                 entity='Subject',
@@ -1030,7 +1035,7 @@ def prerequisite_delete(request, pk):
             prereq_subject = prereq.prereq_subject
 
             # Audit trail
-            AuditTrail.objects.create(
+            record_audit(
                 actor=request.user,
                 action='remove_prerequisite',
                 entity='Subject',
@@ -0,0 +1,32 @@
+import logging
+
+from .utils import audit_buffer, flush_audit_rows
+
+
+logger = logging.getLogger(__name__)
+
+
+class AuditBufferMiddleware:
+    """
+    Collect the audit rows recorded while handling a request and write them
+    in one batch once the view has returned.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with audit_buffer(flush=False) as rows:
+            try:
+                return self.get_response(request)
+            finally:
+                self.flush(rows)
+
+    @staticmethod
+    def flush(rows):
+        # A failed audit INSERT must not replace the view's response (or
+        # exception), so it is logged instead of raised
+        try:
+            flush_audit_rows(rows)
+        except Exception:
+            logger.exception('Failed to write %d buffered audit row(s)', len(rows))
@@ -1,4 +1,5 @@
 # audit/models.py
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 from users.models import User
 
@@ -7,8 +8,9 @@ class AuditTrail(models.Model):
     action = models.CharField(max_length=100)
     entity = models.CharField(max_length=100)
     entity_id = models.BigIntegerField(null=True, blank=True)
-    old_value_json = models.JSONField(null=True, blank=True)
-    new_value_json = models.JSONField(null=True, blank=True)
+    # DjangoJSONEncoder lets callers pass dates/decimals without str() coercion
+    old_value_json = models.JSONField(null=True, blank=True, encoder=DjangoJSONEncoder)
+    new_value_json = models.JSONField(null=True, blank=True, encoder=DjangoJSONEncoder)
     created_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self):
@@ -0,0 +1,82 @@
+from contextlib import contextmanager
+
+from asgiref.local import Local
+from django.db import transaction
+
+from .models import AuditTrail
+
+
+# Request-scoped buffer of pending AuditTrail rows (see audit_buffer)
+_state = Local()
+
+
+def _write_or_buffer(rows):
+    buffer = getattr(_state, 'rows', None)
+    if buffer is None:
+        flush_audit_rows(rows)
+    else:
+        buffer.extend(rows)
+
+
+def record_audit(**fields):
+    """
+    Record an AuditTrail row once the current transaction commits.
+
+    Nothing is recorded if the transaction rolls back. Inside audit_buffer()
+    (i.e. during a request, via AuditBufferMiddleware) the row is buffered and
+    bulk-inserted when the buffer closes; otherwise it is written immediately.
+    """
+    record_audits([fields])
+
+
+def record_audits(rows):
+    """
+    Record several AuditTrail rows, each given as a dict of fields, once the
+    current transaction commits. Same buffering and rollback rules as record_audit.
+    """
+    rows = list(rows)
+    transaction.on_commit(lambda: _write_or_buffer([AuditTrail(**fields) for fields in rows]))
+
+
+def _coalesce(rows):
+    """
+    Merge repeated rows for the same actor/action/entity into one, keeping the
+    first old value and the last new value.
+    """
+    merged = {}
+    result = []
+    for row in rows:
+        if row.entity_id is None:
+            result.append(row)
+            continue
+        key = (row.actor_id, row.action, row.entity, row.entity_id)
+        if key in merged:
+            merged[key].new_value_json = row.new_value_json
+        else:
+            merged[key] = row
+            result.append(row)
+    return result
+
+
+def flush_audit_rows(rows):
+    """Coalesce buffered audit rows and write them with a single bulk_create."""
+    rows = _coalesce(rows)
+    if rows:
+        AuditTrail.objects.bulk_create(rows, batch_size=500)
+
+
+@contextmanager
+def audit_buffer(flush=True):
+    """
+    Buffer audit rows recorded inside the block and yield the buffer.
+    On exit the rows are written with flush_audit_rows, unless flush is False,
+    in which case the caller is responsible for writing them.
+    """
+    previous = getattr(_state, 'rows', None)
+    rows = _state.rows = []
+    try:
+        yield rows
+    finally:
+        _state.rows = previous
+        if flush:
+            flush_audit_rows(rows)
@@ -0,0 +1,153 @@
+"""
+Cache helpers for enrollment data.
+Uses Django's cache framework (configured via settings.CACHES).
+"""
+
+from functools import lru_cache
+
+from django.core.cache import cache
+from django.db import transaction
+
+from academics.models import CurriculumSubject, Prereq, Program
+from .models import Term
+
+
+PROGRAMS_CACHE_KEY = 'programs_all'
+PROGRAMS_CACHE_TTL = 300
+
+ACTIVE_TERM_ID_CACHE_KEY = 'active_term_id'
+ACTIVE_TERM_ID_CACHE_TTL = 3600
+
+TERM_OPTIONS_VERSION_KEY = 'term_options_version'
+
+# Stored in place of None so "no active term" is cached as well
+_NO_ACTIVE_TERM = 0
+
+
+def _grade_version_key(student_id):
+    return f'gradever:{student_id}'
+
+
+def get_grade_version(student_id):
+    """
+    Get the current grade/enrollment version for a student.
+    The version is part of cache keys for data derived from the student's records.
+    """
+    version = cache.get(_grade_version_key(student_id))
+    if version is None:
+        version = 1
+        cache.add(_grade_version_key(student_id), version, None)
+    return version
+
+
+def _incr_grade_version(student_id):
+    key = _grade_version_key(student_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Key missing (expired or never set) - start a fresh version
+        cache.set(key, 2, None)
+
+
+def bump_grade_version(student_id):
+    """
+    Invalidate cached data derived from a student's grades and subjects.
+    Called whenever a Grade or StudentSubject for the student is written.
+
+    The bump runs once the current transaction commits (immediately outside
+    one); bumping earlier would let a concurrent read cache pre-commit rows
+    under the new version.
+    """
+    transaction.on_commit(lambda: _incr_grade_version(student_id))
+
+
+def get_all_programs():
+    """
+    Get all programs as a list, cached for PROGRAMS_CACHE_TTL seconds.
+    Invalidated by the Program signals in enrollment.signals.
+    """
+    programs = cache.get(PROGRAMS_CACHE_KEY)
+    if programs is None:
+        programs = list(Program.objects.all())
+        cache.set(PROGRAMS_CACHE_KEY, programs, PROGRAMS_CACHE_TTL)
+    return programs
+
+
+def invalidate_programs():
+    """Drop the cached program list."""
+    cache.delete(PROGRAMS_CACHE_KEY)
+
+
+def get_term_options_version():
+    """
+    Get the version of the cached term <option> template fragments.
+    Templates pass it to {% cache %} so bumping it retires every variant at once.
+    """
+    version = cache.get(TERM_OPTIONS_VERSION_KEY)
+    if version is None:
+        version = 1
+        cache.add(TERM_OPTIONS_VERSION_KEY, version, None)
+    return version
+
+
+def invalidate_term_options():
+    """Retire the cached term <option> fragments after any term change."""
+    try:
+        cache.incr(TERM_OPTIONS_VERSION_KEY)
+    except ValueError:
+        cache.set(TERM_OPTIONS_VERSION_KEY, 2, None)
+
+
+def _active_term_key(level):
+    return ACTIVE_TERM_ID_CACHE_KEY if level is None else f'active_term:{level}'
+
+
+def get_active_term_id(level=None):
+    """
+    Get the id of the active term (None if no term is active).
+    With a level, only the non-archived active term for that level is considered;
+    without one, the first active term of any level is returned.
+
+    Only the id is cached; fetch the term by pk when the object is needed.
+    Invalidated by the Term signals in enrollment.signals.
+    """
+    key = _active_term_key(level)
+    term_id = cache.get(key)
+    if term_id is None:
+        terms = Term.objects.filter(is_active=True)
+        if level is not None:
+            terms = terms.filter(archived=False, level=level)
+        term_id = terms.values_list('id', flat=True).first() or _NO_ACTIVE_TERM
+        cache.set(key, term_id, ACTIVE_TERM_ID_CACHE_TTL)
+    return term_id or None
+
+
+def invalidate_active_term():
+    """Drop the cached active term ids (global and per level)."""
+    cache.delete_many(
+        [_active_term_key(None)] + [_active_term_key(level) for level, _ in Term.LEVEL_CHOICES]
+    )
+
+
+@lru_cache(maxsize=64)
+def prereq_map_for_curriculum(curriculum_id):
+    """
+    Get the prerequisite graph for a curriculum as {subject_id: (Prereq, ...)}.
+    Every subject in the curriculum has an entry (empty if it has no prerequisites).
+
+    Cached per process; cleared by the Prereq and CurriculumSubject signals in
+    enrollment.signals (and explicitly after bulk writes, which fire none).
+    Clearing only reaches the process that made the change: other workers keep
+    their copy until they restart.
+    """
+    subject_ids = list(
+        CurriculumSubject.objects.filter(
+            curriculum_id=curriculum_id
+        ).values_list('subject_id', flat=True)
+    )
+
+    prereq_map = {subject_id: [] for subject_id in subject_ids}
+    for prereq in Prereq.objects.filter(subject_id__in=subject_ids).select_related('prereq_subject'):
+        prereq_map[prereq.subject_id].append(prereq)
+
+    return {subject_id: tuple(prereqs) for subject_id, prereqs in prereq_map.items()}
@@ -13,7 +13,7 @@ from django.views.decorators.csrf import csrf_protect
 from enrollment.models import Student, Term
 from academics.models import Program
 from users.models import User
-from audit.models import AuditTrail
+from audit.utils import record_audit
 import secrets
 import string
 from datetime import datetime
@@ -179,7 +179,7 @@ def freshman_create_credentials(request):
                 student.save()
 
                 # Audit trail
-                AuditTrail.objects.create(
+                record_audit(
                     actor=user,
                     action='create_credentials',
                     entity='User',
@@ -252,7 +252,7 @@ def freshman_select_course(request):
             student.save()
 
             # Audit trail
-            AuditTrail.objects.create(
+            record_audit(
                 actor=request.user,
                 action='select_course',
                 entity='Student',
@@ -310,7 +310,7 @@ def freshman_confirm_credentials(request):
                 student.save()
 
                 # Audit trail
-                AuditTrail.objects.create(
+                record_audit(
                     actor=request.user,
                     action='complete_onboarding',
                     entity='Student',
@@ -360,7 +360,8 @@ def freshman_enrollment_complete(request):
         return redirect('freshman:create_credentials')
 
     try:
-        student = Student.objects.get(user=request.user)
+        # The page renders the student's name, program and curriculum
+        student = Student.objects.select_related('user', 'program', 'curriculum').get(user=request.user)
     except Student.DoesNotExist:
         return redirect('freshman:create_credentials')
 
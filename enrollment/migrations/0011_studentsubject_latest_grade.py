@@ -0,0 +1,47 @@
+# Generated by Django 5.2.8 on 2025-11-20 09:12
+
+from decimal import Decimal, InvalidOperation
+
+from django.db import migrations, models
+
+
+def backfill_latest_grade(apps, schema_editor):
+    StudentSubject = apps.get_model('enrollment', 'StudentSubject')
+    Grade = apps.get_model('grades', 'Grade')
+    field = StudentSubject._meta.get_field('latest_grade')
+    quantum = Decimal(10) ** -field.decimal_places
+    limit = Decimal(10) ** (field.max_digits - field.decimal_places)
+
+    # Most recently posted grade per StudentSubject, matching grades.signals
+    latest = {}
+    for student_subject_id, grade in Grade.objects.order_by('posted_at', 'id').values_list('student_subject_id', 'grade'):
+        latest[student_subject_id] = grade
+
+    for student_subject_id, grade in latest.items():
+        try:
+            value = Decimal(grade)
+            if not value.is_finite():
+                continue
+            value = value.quantize(quantum)
+        except (InvalidOperation, TypeError):
+            continue
+        if abs(value) >= limit:
+            continue
+        StudentSubject.objects.filter(pk=student_subject_id).update(latest_grade=value)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('enrollment', '0010_transfereeenrollment_transfereecredit'),
+        ('grades', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='studentsubject',
+            name='latest_grade',
+            field=models.DecimalField(blank=True, db_index=True, decimal_places=2, max_digits=5, null=True),
+        ),
+        migrations.RunPython(backfill_latest_grade, migrations.RunPython.noop),
+    ]
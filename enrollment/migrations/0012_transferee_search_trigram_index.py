@@ -0,0 +1,32 @@
+# Generated by Django 5.2.8 on 2025-11-20 10:05
+
+from django.db import migrations
+
+
+def create_trigram_index(apps, schema_editor):
+    # Trigram indexes are PostgreSQL-only; other backends keep plain LIKE scans
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS enrollment_transferee_search_trgm '
+        'ON enrollment_transfereeenrollment USING gin '
+        '(first_name gin_trgm_ops, last_name gin_trgm_ops, email gin_trgm_ops)'
+    )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS enrollment_transferee_search_trgm')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('enrollment', '0011_studentsubject_latest_grade'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
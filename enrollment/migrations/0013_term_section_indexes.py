@@ -0,0 +1,21 @@
+# Generated by Django 5.2.8 on 2025-11-20 10:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('enrollment', '0012_transferee_search_trigram_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='term',
+            index=models.Index(fields=['is_active', 'level'], name='term_active_level_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='section',
+            index=models.Index(fields=['term', '-created_at'], name='section_term_created_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8 on 2025-11-20 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('enrollment', '0013_term_section_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='transfereeenrollment',
+            index=models.Index(fields=['status'], name='transferee_status_idx'),
+        ),
+    ]
@@ -41,10 +41,24 @@ class Term(models.Model):
 
     class Meta:
         unique_together = ('name', 'level')
+        indexes = [
+            models.Index(fields=['is_active', 'level'], name='term_active_level_idx'),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.get_level_display()})"
 
+    def audit_snapshot(self):
+        """Get the audited term fields as a dict (dates are encoded by AuditTrail)"""
+        return {
+            'name': self.name,
+            'level': self.level,
+            'start_date': self.start_date,
+            'end_date': self.end_date,
+            'add_drop_deadline': self.add_drop_deadline,
+            'grade_encoding_deadline': self.grade_encoding_deadline,
+        }
+
 
 class Section(models.Model):
     STATUS_CHOICES = [('open', 'Open'), ('full', 'Full'), ('closed', 'Closed')]
@@ -58,6 +72,9 @@ class Section(models.Model):
 
     class Meta:
         unique_together = ('term', 'section_code')
+        indexes = [
+            models.Index(fields=['term', '-created_at'], name='section_term_created_idx'),
+        ]
 
     def __str__(self):
         subjects_list = ', '.join([s.code for s in self.subjects.all()])
@@ -66,6 +83,9 @@ class Section(models.Model):
     @property
     def enrolled_count(self):
         """Count the number of enrolled students in this section"""
+        # Use the count annotated by list views when present
+        if hasattr(self, 'enrolled_total'):
+            return self.enrolled_total
         return self.studentsubject_set.filter(status='enrolled').count()
 
     @property
@@ -96,6 +116,8 @@ class StudentSubject(models.Model):
     section = models.ForeignKey(Section, on_delete=models.CASCADE, null=True, blank=True)
     professor = models.ForeignKey(User, on_delete=models.CASCADE, limit_choices_to={'role': 'professor'}, null=True, blank=True)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='enrolled')
+    # Denormalized copy of the most recently posted Grade, kept in sync by grades.signals
+    latest_grade = models.DecimalField(max_digits=5, decimal_places=2, null=True, blank=True, db_index=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
 
@@ -184,6 +206,9 @@ class TransfereeEnrollment(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status'], name='transferee_status_idx'),
+        ]
 
     def __str__(self):
         return f"{self.first_name} {self.last_name} - {self.get_transfer_type_display()}"
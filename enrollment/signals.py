@@ -0,0 +1,45 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from academics.models import CurriculumSubject, Prereq, Program
+from .cache_utils import (
+    bump_grade_version, invalidate_active_term, invalidate_programs, invalidate_term_options,
+    prereq_map_for_curriculum,
+)
+from .models import StudentSubject, Term
+
+
+@receiver(post_save, sender=StudentSubject)
+@receiver(post_delete, sender=StudentSubject)
+def invalidate_student_subject_cache(sender, instance, **kwargs):
+    """Invalidate cached availability data when a student's subjects change."""
+    bump_grade_version(instance.student_id)
+
+
+@receiver(post_save, sender=Prereq)
+@receiver(post_delete, sender=Prereq)
+def invalidate_prereq_map(sender, instance, **kwargs):
+    """Drop cached prerequisite graphs when any prerequisite changes."""
+    prereq_map_for_curriculum.cache_clear()
+
+
+@receiver(post_save, sender=CurriculumSubject)
+@receiver(post_delete, sender=CurriculumSubject)
+def invalidate_prereq_map_on_curriculum_change(sender, instance, **kwargs):
+    """Drop cached prerequisite graphs when a curriculum's subject list changes."""
+    prereq_map_for_curriculum.cache_clear()
+
+
+@receiver(post_save, sender=Program)
+@receiver(post_delete, sender=Program)
+def invalidate_program_cache(sender, instance, **kwargs):
+    """Drop the cached program list when any program changes."""
+    invalidate_programs()
+
+
+@receiver(post_save, sender=Term)
+@receiver(post_delete, sender=Term)
+def invalidate_term_cache(sender, instance, **kwargs):
+    """Drop cached term data when any term is created, activated, closed, archived or deleted."""
+    invalidate_active_term()
+    invalidate_term_options()
@@ -6,20 +6,36 @@ Handles subject selection, validation, and enrollment confirmation.
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
+from django.core.cache import cache
 from django.db import transaction
+from django.db.models import Sum
 from django.http import JsonResponse
 from django.views.decorators.http import require_http_methods
 from enrollment.models import Student, Term, StudentSubject, Enrollment
+from enrollment.cache_utils import bump_grade_version, get_grade_version, prereq_map_for_curriculum
 from academics.models import Subject, CurriculumSubject, Prereq, Program
-from audit.models import AuditTrail
+from audit.utils import record_audit
 from grades.models import Grade
-from settingsapp.models import Setting
+from settingsapp.cache_utils import is_enrollment_open
 import json
+from collections import Counter
 from decimal import Decimal
 
 
+# Seconds to keep a student's computed subject availability in the cache
+AVAILABLE_SUBJECTS_CACHE_TTL = 300
+
+
 # ==================== HELPER FUNCTIONS ====================
 
+def _get_student(request):
+    """
+    Get the Student record for the logged-in user with program, curriculum,
+    and user joined in a single query. Raises Student.DoesNotExist.
+    """
+    return Student.objects.select_related('program', 'curriculum', 'user').get(user=request.user)
+
+
 def get_student_grade_history(student):
     """
     Get all subjects the student has taken with grades and status.
@@ -28,19 +44,24 @@ def get_student_grade_history(student):
     past_subjects = StudentSubject.objects.filter(
         student=student,
         status__in=['completed', 'failed', 'inc', 'repeat_required']
-    ).select_related('subject', 'term', 'professor').order_by('-term__start_date')
+    ).select_related('subject', 'term', 'professor').only(
+        'id', 'status', 'latest_grade',
+        'subject__code', 'subject__title', 'subject__units',
+        'term__name', 'term__start_date',
+        'professor__first_name', 'professor__last_name',
+    ).order_by('-term__start_date')
 
     grade_history = []
     for ss in past_subjects:
-        grade = Grade.objects.filter(student_subject=ss).first()
+        grade = ss.latest_grade
         grade_history.append({
             'student_subject': ss,
             'subject': ss.subject,
             'term': ss.term,
             'professor': ss.professor,
             'status': ss.status,
-            'grade': grade.grade if grade else 'Not Posted',
-            'grade_value': float(grade.grade) if grade else None,
+            'grade': grade if grade is not None else 'Not Posted',
+            'grade_value': float(grade) if grade is not None else None,
         })
 
     return grade_history
@@ -53,18 +74,17 @@ def get_completed_subjects_with_grades(student):
     """
     completed = StudentSubject.objects.filter(
         student=student,
-        status='completed'
+        status='completed',
+        latest_grade__isnull=False
     ).select_related('subject')
 
     result = {}
     for ss in completed:
-        grade = Grade.objects.filter(student_subject=ss).first()
-        if grade:
-            result[ss.subject_id] = {
-                'grade_value': float(grade.grade),
-                'subject': ss.subject,
-                'status': 'completed',
-            }
+        result[ss.subject_id] = {
+            'grade_value': float(ss.latest_grade),
+            'subject': ss.subject,
+            'status': 'completed',
+        }
 
     return result
 
@@ -77,7 +97,7 @@ def get_incomplete_subjects(student):
     return StudentSubject.objects.filter(
         student=student,
         status='inc'
-    ).select_related('subject', 'term')
+    ).select_related('subject', 'term').only('id', 'status', 'subject__code', 'term__name')
 
 
 def get_student_current_level(student):
@@ -88,7 +108,7 @@ def get_student_current_level(student):
     Returns (year_level, term_no) tuple.
     Defaults to (1, 1) for new students.
     """
-    if not student.curriculum:
+    if not student.curriculum_id:
         return (1, 1)
 
     # Get all subjects the student has taken (completed or failed)
@@ -97,17 +117,15 @@ def get_student_current_level(student):
         status__in=['completed', 'failed']
     ).values_list('subject_id', flat=True)
 
-    # Get all curriculum subjects taken by this student
-    completed_curriculum = CurriculumSubject.objects.filter(
-        curriculum=student.curriculum,
+    # Find the highest year/semester among curriculum subjects taken by this student
+    max_level = CurriculumSubject.objects.filter(
+        curriculum_id=student.curriculum_id,
         subject_id__in=taken_subjects
-    ).values_list('year_level', 'term_no')
+    ).order_by('-year_level', '-term_no').values_list('year_level', 'term_no').first()
 
-    if not completed_curriculum:
+    if not max_level:
         return (1, 1)
 
-    # Find the highest year/semester completed
-    max_level = max(completed_curriculum, key=lambda x: (x[0], x[1]))
     year_level, term_no = max_level
 
     # Advance to next semester/year
@@ -117,12 +135,45 @@ def get_student_current_level(student):
         return (year_level + 1, 1)
 
 
-def check_prerequisite_with_grades(student, subject, passing_grade=None):
+def _get_completed_ids(request, student):
+    """
+    Get the set of subject ids the student has completed.
+    Cached on request._completed_ids since it is stable within a request.
+    """
+    completed_ids = getattr(request, '_completed_ids', None)
+    if completed_ids is None:
+        completed_ids = request._completed_ids = frozenset(
+            StudentSubject.objects.filter(
+                student=student,
+                status='completed'
+            ).values_list('subject_id', flat=True)
+        )
+    return completed_ids
+
+
+def get_subject_prereqs(student, subject):
+    """
+    Get the Prereq records for a subject.
+    Uses the cached prerequisite graph of the student's curriculum and falls
+    back to a query for subjects outside the curriculum.
+    """
+    if student.curriculum_id:
+        prereq_map = prereq_map_for_curriculum(student.curriculum_id)
+        if subject.id in prereq_map:
+            return prereq_map[subject.id]
+
+    return list(Prereq.objects.filter(subject=subject).select_related('prereq_subject'))
+
+
+def check_prerequisite_with_grades(student, subject, passing_grade=None, completed_ids=None):
     """
     Check if student has met all prerequisites for a subject.
     Accepts both 'completed' subjects AND 'inc' subjects where the grade
     meets or exceeds the passing grade.
 
+    If completed_ids (a set of completed subject ids) is given, the completed
+    check is a set lookup instead of a query per prerequisite.
+
     Returns dict with:
     - 'can_take': bool - whether student can take this subject
     - 'unmet': list of unmet prerequisite subjects
@@ -133,9 +184,9 @@ def check_prerequisite_with_grades(student, subject, passing_grade=None):
         passing_grade = float(student.program.passing_grade)
 
     # Get all prerequisites for this subject
-    prereqs = Prereq.objects.filter(subject=subject).select_related('prereq_subject')
+    prereqs = get_subject_prereqs(student, subject)
 
-    if not prereqs.exists():
+    if not prereqs:
         return {'can_take': True, 'unmet': [], 'with_inc': []}
 
     unmet = []
@@ -145,13 +196,14 @@ def check_prerequisite_with_grades(student, subject, passing_grade=None):
         prereq_subject = prereq.prereq_subject
 
         # Check if completed
-        completed_record = StudentSubject.objects.filter(
+        if completed_ids is not None:
+            if prereq_subject.id in completed_ids:
+                continue
+        elif StudentSubject.objects.filter(
             student=student,
             subject=prereq_subject,
             status='completed'
-        ).first()
-
-        if completed_record:
+        ).exists():
             continue
 
         # Check if incomplete - this BLOCKS enrollment regardless of grade
@@ -162,12 +214,12 @@ def check_prerequisite_with_grades(student, subject, passing_grade=None):
         ).first()
 
         if inc_record:
-            grade = Grade.objects.filter(student_subject=inc_record).first()
-            if grade and float(grade.grade) >= passing_grade:
+            grade = inc_record.latest_grade
+            if grade is not None and float(grade) >= passing_grade:
                 # INC with passing grade - record it but still block enrollment
                 with_inc.append({
                     'subject': prereq_subject,
-                    'grade': grade.grade,
+                    'grade': grade,
                     'status': 'incomplete_but_passing'
                 })
                 # Continue to treat this as blocking (don't allow enrollment)
@@ -189,7 +241,26 @@ def check_prerequisite_with_grades(student, subject, passing_grade=None):
     }
 
 
-def get_available_subjects_for_student(student, active_term, include_inc_path=False):
+def _prereq_check_cached(request, student, subject, passing_grade=None):
+    """
+    Request-scoped memoized wrapper around check_prerequisite_with_grades.
+    Results are stored on request._prereq_cache keyed by (student.id, subject.id),
+    so repeated checks for the same subject within one request hit the DB once.
+    """
+    cache = getattr(request, '_prereq_cache', None)
+    if cache is None:
+        cache = request._prereq_cache = {}
+
+    key = (student.id, subject.id)
+    if key not in cache:
+        cache[key] = check_prerequisite_with_grades(
+            student, subject, passing_grade,
+            completed_ids=_get_completed_ids(request, student),
+        )
+    return cache[key]
+
+
+def get_available_subjects_for_student(student, active_term, include_inc_path=False, request=None):
     """
     Get all curriculum subjects for student with detailed availability info.
 
@@ -204,6 +275,7 @@ def get_available_subjects_for_student(student, active_term, include_inc_path=Fa
 
     If include_inc_path=True: Show current level + one level ahead if student has incomplete subjects.
     If include_inc_path=False: Only show current level subjects.
+    If request is given, prerequisite checks are memoized on it for reuse by the caller.
 
     Returns list of dicts with subject info, status, and blocking reasons.
     """
@@ -223,7 +295,10 @@ def get_available_subjects_for_student(student, active_term, include_inc_path=Fa
     # Get ALL curriculum subjects (not just visible levels) to show full curriculum
     all_curriculum_subjects = CurriculumSubject.objects.filter(
         curriculum=student.curriculum
-    ).select_related('subject').order_by('year_level', 'term_no', 'subject__code')
+    ).select_related('subject').only(
+        'year_level', 'term_no',
+        'subject__code', 'subject__title', 'subject__units',
+    ).order_by('year_level', 'term_no', 'subject__code')
 
     # Check past completions to identify already taken subjects
     completed_subject_ids = StudentSubject.objects.filter(
@@ -231,6 +306,23 @@ def get_available_subjects_for_student(student, active_term, include_inc_path=Fa
         status__in=['completed', 'failed', 'inc', 'repeat_required']
     ).values_list('subject_id', flat=True).distinct()
 
+    # Subjects already enrolled in the current term
+    taken = set(
+        StudentSubject.objects.filter(
+            student=student,
+            term=active_term
+        ).values_list('subject_id', flat=True)
+    )
+
+    # Curriculum subjects known to have no prerequisites. Subjects missing from
+    # the cached map (added to the curriculum after it was built) are not
+    # assumed free and go through the full prerequisite check below.
+    subjects_without_prereqs = {
+        subject_id
+        for subject_id, prereqs in prereq_map_for_curriculum(student.curriculum_id).items()
+        if not prereqs
+    }
+
     subjects_info = []
     passing_grade = float(student.program.passing_grade)
 
@@ -264,13 +356,7 @@ def get_available_subjects_for_student(student, active_term, include_inc_path=Fa
             continue
 
         # Check if already enrolled in current term
-        already_enrolled_current = StudentSubject.objects.filter(
-            student=student,
-            subject=subject,
-            term=active_term
-        ).exists()
-
-        if already_enrolled_current:
+        if cs.subject_id in taken:
             # Skip - already in current enrollment selection
             continue
 
@@ -281,8 +367,19 @@ def get_available_subjects_for_student(student, active_term, include_inc_path=Fa
             subjects_info.append(subject_info)
             continue
 
-        # At this level - check prerequisites
-        prereq_check = check_prerequisite_with_grades(student, subject, passing_grade)
+        # At this level - subjects without prerequisites are always ready
+        if cs.subject_id in subjects_without_prereqs:
+            subject_info['status'] = 'ready'
+            subject_info['can_take'] = True
+            subject_info['is_available'] = True
+            subjects_info.append(subject_info)
+            continue
+
+        # Check prerequisites
+        if request is not None:
+            prereq_check = _prereq_check_cached(request, student, subject, passing_grade)
+        else:
+            prereq_check = check_prerequisite_with_grades(student, subject, passing_grade)
 
         subject_info['unmet_prereqs'] = prereq_check['unmet']
         subject_info['with_inc_prereqs'] = prereq_check['with_inc']
@@ -316,6 +413,25 @@ def get_available_subjects_for_student(student, active_term, include_inc_path=Fa
     return subjects_info, has_inc
 
 
+def get_available_subjects_cached(student, active_term, include_inc_path=False, request=None):
+    """
+    Cached wrapper around get_available_subjects_for_student.
+    The key includes the student's grade version, which is bumped whenever a
+    Grade or StudentSubject for the student is written (see enrollment.signals).
+    """
+    key = (
+        f'avail:{student.id}:{active_term.id}:{int(include_inc_path)}'
+        f':v{get_grade_version(student.id)}'
+    )
+    result = cache.get(key)
+    if result is None:
+        result = get_available_subjects_for_student(
+            student, active_term, include_inc_path=include_inc_path, request=request
+        )
+        cache.set(key, result, AVAILABLE_SUBJECTS_CACHE_TTL)
+    return result
+
+
 def can_student_enroll(student, active_term):
     """
     Comprehensive check for student enrollment eligibility.
@@ -339,8 +455,7 @@ def can_student_enroll(student, active_term):
     """
 
     # Check 1: Is enrollment open?
-    enrollment_setting = Setting.objects.filter(key_name='enrollment_open').first()
-    if not enrollment_setting or enrollment_setting.value_text.lower() != 'true':
+    if not is_enrollment_open():
         return False, 'Enrollment is currently closed. Please check back later.', {
             'reason': 'enrollment_closed',
             'open': False
@@ -454,8 +569,12 @@ def student_enroll_subjects(request):
     Shows available subjects based on student's current level and incomplete status.
     Handles prerequisite checking for both completed and incomplete (but passing) subjects.
     """
+    # Reset the per-request prerequisite caches
+    request._prereq_cache = {}
+    request._completed_ids = None
+
     try:
-        student = Student.objects.get(user=request.user)
+        student = _get_student(request)
     except Student.DoesNotExist:
         messages.error(request, 'Student record not found.')
         return redirect('student_dashboard')
@@ -485,7 +604,9 @@ def student_enroll_subjects(request):
     year_level, term_no = get_student_current_level(student)
 
     # Get available subjects with prerequisite info
-    available_subjects, has_incomplete = get_available_subjects_for_student(student, active_term, include_inc_path=True)
+    available_subjects, has_incomplete = get_available_subjects_cached(
+        student, active_term, include_inc_path=True, request=request
+    )
 
     # Get grade history
     grade_history = get_student_grade_history(student)
@@ -516,7 +637,7 @@ def student_enroll_subjects(request):
             selected_subjects = Subject.objects.filter(id__in=selected_subject_ids)
 
             # Check unit total
-            total_units = sum(Decimal(str(s.units)) for s in selected_subjects)
+            total_units = selected_subjects.aggregate(total=Sum('units'))['total'] or Decimal('0')
 
             if total_units > 30:
                 messages.error(request, f'Total units ({total_units}) exceeds maximum of 30 units.')
@@ -534,7 +655,7 @@ def student_enroll_subjects(request):
 
             # Check prerequisites for selected subjects using new logic
             for subject in selected_subjects:
-                prereq_check = check_prerequisite_with_grades(student, subject)
+                prereq_check = _prereq_check_cached(request, student, subject)
                 if not prereq_check['can_take']:
                     unmet_codes = ', '.join([p.code for p in prereq_check['unmet']])
                     messages.error(request, f'Subject {subject.code} has unmet prerequisites: {unmet_codes}')
@@ -600,7 +721,7 @@ def student_confirm_enrollment(request):
     Shows summary of selected subjects and requires final confirmation.
     """
     try:
-        student = Student.objects.get(user=request.user)
+        student = _get_student(request)
     except Student.DoesNotExist:
         messages.error(request, 'Student record not found.')
         return redirect('student_dashboard')
@@ -626,6 +747,21 @@ def student_confirm_enrollment(request):
         # Confirm enrollment - lock it
         try:
             with transaction.atomic():
+                # Lock the student's rows for this term so concurrent
+                # submissions (e.g. double-clicks) are serialized
+                Student.objects.select_for_update().filter(pk=student.pk).exists()
+                already_enrolled_ids = {
+                    ss.subject_id
+                    for ss in StudentSubject.objects.select_for_update().filter(
+                        student=student,
+                        term=active_term
+                    )
+                }
+
+                if already_enrolled_ids.intersection(selected_subject_ids):
+                    messages.error(request, 'You are already enrolled in some of the selected subjects this term.')
+                    return redirect('enrollment:view_enrollment', term_id=active_term.id)
+
                 # Create Enrollment record (locked)
                 enrollment, created = Enrollment.objects.get_or_create(
                     student=student,
@@ -648,6 +784,7 @@ def student_confirm_enrollment(request):
                 # Create StudentSubject records
                 # In a real system, you'd assign sections based on availability
                 # For now, we'll use the first available section
+                new_subjects = []
                 for subject in selected_subjects:
                     # Get an available section for this subject and term
                     section = subject.sections.filter(term=active_term, status='open').first()
@@ -661,17 +798,21 @@ def student_confirm_enrollment(request):
 
                     # Create StudentSubject record even if section/professor is not assigned
                     # They can be assigned later by the registrar
-                    StudentSubject.objects.create(
+                    new_subjects.append(StudentSubject(
                         student=student,
                         subject=subject,
                         term=active_term,
                         section=section,
                         professor=professor,
                         status='enrolled'
-                    )
+                    ))
+
+                StudentSubject.objects.bulk_create(new_subjects)
+                # bulk_create skips post_save signals, so invalidate cached data here
+                bump_grade_version(student.id)
 
                 # Audit trail
-                AuditTrail.objects.create(
+                record_audit(
                     actor=request.user,
                     action='confirm_enrollment',
                     entity='Enrollment',
@@ -715,7 +856,7 @@ def student_view_enrollment(request, term_id):
     Shows locked enrollment once confirmed.
     """
     try:
-        student = Student.objects.get(user=request.user)
+        student = _get_student(request)
     except Student.DoesNotExist:
         messages.error(request, 'Student record not found.')
         return redirect('student_dashboard')
@@ -733,7 +874,12 @@ def student_view_enrollment(request, term_id):
         student=student,
         term=term,
         status='enrolled'
-    ).select_related('subject', 'section', 'professor')
+    ).select_related('subject', 'section', 'professor').only(
+        'id', 'status',
+        'subject__code', 'subject__title', 'subject__description', 'subject__units',
+        'section__section_code',
+        'professor__first_name', 'professor__last_name',
+    )
 
     context = {
         'student': student,
@@ -751,7 +897,7 @@ def student_grade_history(request):
     Shows all completed, failed, incomplete, and repeat required subjects.
     """
     try:
-        student = Student.objects.get(user=request.user)
+        student = _get_student(request)
     except Student.DoesNotExist:
         messages.error(request, 'Student record not found.')
         return redirect('student_dashboard')
@@ -770,13 +916,15 @@ def student_grade_history(request):
         total_grade = sum(gh['grade_value'] for gh in completed_with_grades)
         gpa = total_grade / len(completed_with_grades)
 
+    status_counts = Counter(gh['status'] for gh in grade_history)
+
     context = {
         'student': student,
         'grade_history': grade_history,
         'gpa': gpa,
-        'total_completed': len([gh for gh in grade_history if gh['status'] == 'completed']),
-        'total_failed': len([gh for gh in grade_history if gh['status'] == 'failed']),
-        'total_incomplete': len([gh for gh in grade_history if gh['status'] == 'inc']),
+        'total_completed': status_counts['completed'],
+        'total_failed': status_counts['failed'],
+        'total_incomplete': status_counts['inc'],
     }
     return render(request, 'student/grade_history.html', context)
 
@@ -788,24 +936,29 @@ def api_check_prerequisites(request):
     API endpoint to check if prerequisites are met for a subject.
     Returns JSON with prerequisite information including incomplete but passing subjects.
     """
+    # Reset the per-request prerequisite caches
+    request._prereq_cache = {}
+    request._completed_ids = None
+
     subject_id = request.GET.get('subject_id')
 
     if not subject_id:
         return JsonResponse({'error': 'subject_id required'}, status=400)
 
     try:
-        student = Student.objects.get(user=request.user)
+        student = _get_student(request)
         subject = Subject.objects.get(id=subject_id)
     except (Student.DoesNotExist, Subject.DoesNotExist):
         return JsonResponse({'error': 'Not found'}, status=404)
 
     # Use new prerequisite checking logic
-    prereq_check = check_prerequisite_with_grades(student, subject)
+    prereq_check = _prereq_check_cached(request, student, subject)
 
     # Get prerequisites
-    prereqs = Prereq.objects.filter(subject=subject).select_related('prereq_subject')
+    prereqs = get_subject_prereqs(student, subject)
 
     prerequisite_info = []
+    completed_ids = _get_completed_ids(request, student)
 
     for prereq in prereqs:
         prereq_subject = prereq.prereq_subject
@@ -813,11 +966,7 @@ def api_check_prerequisites(request):
         status = 'unmet'
 
         # Check if completed
-        if StudentSubject.objects.filter(
-            student=student,
-            subject=prereq_subject,
-            status='completed'
-        ).exists():
+        if prereq_subject.id in completed_ids:
             is_met = True
             status = 'completed'
         # Check if incomplete but passing
@@ -7,20 +7,39 @@ from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.contrib.auth import authenticate, login as auth_login
-from django.db import transaction
+from django.core.paginator import Paginator
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Prefetch, Q, Value
 from django.http import JsonResponse
 from users.decorators import role_required
-from .models import TransfereeEnrollment, TransfereeCredit, Student
+from .models import TransfereeEnrollment, TransfereeCredit, Student, StudentSubject
+from .freshman_views import generate_student_id
+from .cache_utils import bump_grade_version, get_active_term_id, get_all_programs
 from users.models import User
-from audit.models import AuditTrail
-from datetime import datetime
+from audit.utils import record_audit, record_audits
+from django.utils import timezone
 import secrets
 import string
 
 
+# Number of transferees shown per page in transferee_list
+TRANSFEREES_PER_PAGE = 25
+
+# Username collisions are retried this many times before giving up
+USERNAME_CREATE_ATTEMPTS = 5
+
+# Session key holding generated credentials until they are shown once
+TRANSFEREE_CREDENTIALS_SESSION_KEY = 'transferee_credentials'
+
+
+# Character pool and CSPRNG used by generate_transferee_password
+_PASSWORD_SPECIALS = "!@#$%&"
+_PASSWORD_POOL = string.ascii_uppercase + string.ascii_lowercase + string.digits + _PASSWORD_SPECIALS
+_SYSTEM_RANDOM = secrets.SystemRandom()
+
+
 def generate_transferee_password():
     """Generate a secure random password for transferee account"""
-    password_chars = string.ascii_uppercase + string.ascii_lowercase + string.digits + "!@#$%&"
     generated_password = (
         secrets.choice(string.ascii_uppercase) +
         secrets.choice(string.ascii_uppercase) +
@@ -28,11 +47,27 @@ def generate_transferee_password():
         secrets.choice(string.ascii_lowercase) +
         secrets.choice(string.digits) +
         secrets.choice(string.digits) +
-        secrets.choice("!@#$%&") +
-        ''.join(secrets.choice(password_chars) for _ in range(5))
+        secrets.choice(_PASSWORD_SPECIALS) +
+        ''.join(secrets.choice(_PASSWORD_POOL) for _ in range(5))
     )
     # Shuffle to make it less predictable
-    return ''.join(secrets.SystemRandom().sample(generated_password, len(generated_password)))
+    return ''.join(_SYSTEM_RANDOM.sample(generated_password, len(generated_password)))
+
+
+def email_duplicates(email):
+    """
+    Return (user_exists, transferee_exists) for an email in a single query.
+    """
+    # UNION of one tag per matching table; the distinct UNION returns at most two rows
+    found = set(
+        User.objects.filter(email=email).order_by()
+        .annotate(source=Value('user')).values_list('source', flat=True)
+        .union(
+            TransfereeEnrollment.objects.filter(email=email).order_by()
+            .annotate(source=Value('transferee')).values_list('source', flat=True)
+        )
+    )
+    return 'user' in found, 'transferee' in found
 
 
 @login_required
@@ -41,7 +76,11 @@ def transferee_list(request):
     """
     List all transferee enrollments with filtering and search.
     """
-    transferees = TransfereeEnrollment.objects.all()
+    # Load only the columns the list template renders
+    transferees = TransfereeEnrollment.objects.select_related('program').only(
+        'id', 'first_name', 'last_name', 'email', 'status', 'transfer_type',
+        'tor_verified', 'created_user', 'account_created_at', 'program__name',
+    )
 
     # Filtering
     status = request.GET.get('status')
@@ -53,16 +92,26 @@ def transferee_list(request):
     if transfer_type:
         transferees = transferees.filter(transfer_type=transfer_type)
     if search:
-        transferees = transferees.filter(
-            first_name__icontains=search
-        ) | transferees.filter(
-            last_name__icontains=search
-        ) | transferees.filter(
-            email__icontains=search
+        search_filter = (
+            Q(first_name__icontains=search) |
+            Q(last_name__icontains=search) |
+            Q(email__icontains=search)
         )
+        if connection.vendor == 'postgresql':
+            # Served by the pg_trgm GIN index; also ranks close misspellings
+            from django.contrib.postgres.search import TrigramSimilarity
+            transferees = transferees.annotate(
+                similarity=TrigramSimilarity('first_name', search) + TrigramSimilarity('last_name', search)
+            ).filter(search_filter | Q(similarity__gt=0.1)).order_by('-similarity', '-created_at')
+        else:
+            transferees = transferees.filter(search_filter)
+
+    paginator = Paginator(transferees, TRANSFEREES_PER_PAGE)
+    page_obj = paginator.get_page(request.GET.get('page'))
 
     context = {
-        'transferees': transferees,
+        'transferees': page_obj,
+        'page_obj': page_obj,
         'status_choices': TransfereeEnrollment.STATUS_CHOICES,
         'transfer_type_choices': TransfereeEnrollment.TRANSFER_TYPE_CHOICES,
         'current_status': status,
@@ -119,17 +168,16 @@ def transferee_create(request):
         if not curriculum_id:
             errors.append('Target curriculum is required.')
 
-        # Check if email already exists
-        if User.objects.filter(email=email).exists():
+        # Check if email already exists as a user and/or as a transferee
+        user_dup, transferee_dup = email_duplicates(email)
+        if user_dup:
             errors.append('Email already exists in the system.')
-
-        # Check if transferee email already exists
-        if TransfereeEnrollment.objects.filter(email=email).exists():
+        if transferee_dup:
             errors.append('This email is already registered as a transferee.')
 
         if errors:
             context = {
-                'programs': Program.objects.all(),
+                'programs': get_all_programs(),
                 'errors': errors,
                 'form_data': request.POST,
             }
@@ -157,12 +205,12 @@ def transferee_create(request):
                 notes=notes,
                 status='tor_verified',  # Skip pending verification, go directly to verified
                 tor_verified=True,
-                tor_verified_at=datetime.now(),
+                tor_verified_at=timezone.now(),
                 tor_verified_by=request.user,
             )
 
             # Audit trail
-            AuditTrail.objects.create(
+            record_audit(
                 actor=request.user,
                 action='create_transferee_enrollment',
                 entity='TransfereeEnrollment',
@@ -188,9 +236,8 @@ def transferee_create(request):
             messages.error(request, f'Error creating transferee enrollment: {str(e)}')
 
     # GET request
-    from academics.models import Program
     context = {
-        'programs': Program.objects.all(),
+        'programs': get_all_programs(),
     }
     return render(request, 'transferee/transferee_form.html', context)
 
@@ -202,7 +249,12 @@ def transferee_detail(request, pk):
     View transferee enrollment details and manage account creation.
     TOR is verified during initial enrollment creation (single flow).
     """
-    transferee = get_object_or_404(TransfereeEnrollment, pk=pk)
+    transferee = get_object_or_404(
+        TransfereeEnrollment.objects.prefetch_related(
+            Prefetch('credits', queryset=TransfereeCredit.objects.select_related('subject'))
+        ),
+        pk=pk,
+    )
 
     if request.method == 'POST':
         action = request.POST.get('action')
@@ -219,25 +271,28 @@ def transferee_detail(request, pk):
 
             try:
                 with transaction.atomic():
-                    # Generate username
-                    generated_username = f"{transferee.last_name.lower()}{transferee.first_name.lower()}{secrets.token_hex(3)}"
-
-                    # Check if username exists
-                    while User.objects.filter(username=generated_username).exists():
-                        generated_username = f"{transferee.last_name.lower()}{transferee.first_name.lower()}{secrets.token_hex(3)}"
-
                     # Generate password
                     generated_password = generate_transferee_password()
 
-                    # Create user
-                    user = User.objects.create_user(
-                        username=generated_username,
-                        email=transferee.email,
-                        password=generated_password,
-                        first_name=transferee.first_name,
-                        last_name=transferee.last_name,
-                        role='student',
-                    )
+                    # Create user; rely on the unique username constraint and
+                    # retry with a fresh suffix on the rare collision
+                    username_base = f"{transferee.last_name.lower()}{transferee.first_name.lower()}"
+                    for attempt in range(USERNAME_CREATE_ATTEMPTS):
+                        generated_username = f"{username_base}{secrets.token_hex(3)}"
+                        try:
+                            with transaction.atomic():
+                                user = User.objects.create_user(
+                                    username=generated_username,
+                                    email=transferee.email,
+                                    password=generated_password,
+                                    first_name=transferee.first_name,
+                                    last_name=transferee.last_name,
+                                    role='student',
+                                )
+                            break
+                        except IntegrityError:
+                            if attempt == USERNAME_CREATE_ATTEMPTS - 1:
+                                raise
 
                     # Create student record
                     student = Student.objects.create(
@@ -249,35 +304,40 @@ def transferee_detail(request, pk):
                     )
 
                     # Generate and assign student ID
-                    from enrollment.freshman_views import generate_student_id
                     student.student_id = generate_student_id(student)
-                    student.save()
-
-                    # Credit subjects from TOR
-                    credits = transferee.credits.filter(status='credited')
-                    for credit in credits:
-                        if credit.subject:  # Only credit if subject is mapped
-                            StudentSubject = __import__('enrollment.models', fromlist=['StudentSubject']).StudentSubject
-                            # Use active term for credits
-                            from enrollment.models import Term
-                            active_term = Term.objects.filter(is_active=True).first()
-                            if active_term:
-                                StudentSubject.objects.create(
-                                    student=student,
-                                    subject=credit.subject,
-                                    term=active_term,
-                                    status='completed',
-                                )
+                    student.save(update_fields=['student_id'])
+
+                    # Credit subjects from TOR against the active term
+                    active_term_id = get_active_term_id()
+                    if active_term_id:
+                        # Built from the prefetched credits using raw FK ids, so no
+                        # queries run here; only credit subjects that are mapped
+                        credited_rows = [
+                            StudentSubject(
+                                student_id=student.id,
+                                subject_id=credit.subject_id,
+                                term_id=active_term_id,
+                                status='completed',
+                            )
+                            for credit in transferee.credits.all()
+                            if credit.status == 'credited' and credit.subject_id
+                        ]
+                        if credited_rows:
+                            StudentSubject.objects.bulk_create(credited_rows, batch_size=500)
+                            # bulk_create skips post_save, so invalidate cached availability here
+                            bump_grade_version(student.id)
 
                     # Update transferee record
                     transferee.created_user = user
-                    transferee.account_created_at = datetime.now()
+                    transferee.account_created_at = timezone.now()
                     transferee.account_created_by = request.user
                     transferee.status = 'account_created'
-                    transferee.save()
+                    transferee.save(update_fields=[
+                        'created_user', 'account_created_at', 'account_created_by', 'status', 'updated_at',
+                    ])
 
                     # Audit trail
-                    AuditTrail.objects.create(
+                    record_audit(
                         actor=request.user,
                         action='create_transferee_account',
                         entity='TransfereeEnrollment',
@@ -289,9 +349,11 @@ def transferee_detail(request, pk):
                     )
 
                 # Store credentials in session for display
-                request.session['transferee_username'] = generated_username
-                request.session['transferee_password'] = generated_password
-                request.session['transferee_student_id'] = student.student_id
+                request.session[TRANSFEREE_CREDENTIALS_SESSION_KEY] = {
+                    'username': generated_username,
+                    'password': generated_password,
+                    'student_id': student.student_id,
+                }
 
                 messages.success(request, 'Account created successfully! Now add completed subjects from previous school.')
                 return redirect('enrollment:transferee_credit_subjects', pk=pk)
@@ -309,10 +371,10 @@ def transferee_detail(request, pk):
 
             transferee.status = 'rejected'
             transferee.rejection_reason = rejection_reason
-            transferee.save()
+            transferee.save(update_fields=['status', 'rejection_reason', 'updated_at'])
 
             # Audit trail
-            AuditTrail.objects.create(
+            record_audit(
                 actor=request.user,
                 action='reject_transferee',
                 entity='TransfereeEnrollment',
@@ -342,15 +404,13 @@ def transferee_account_details(request, pk):
         messages.error(request, 'Account not yet created for this transferee.')
         return redirect('enrollment:transferee_detail', pk=pk)
 
-    username = request.session.pop('transferee_username', None)
-    password = request.session.pop('transferee_password', None)
-    student_id = request.session.pop('transferee_student_id', None)
+    credentials = request.session.pop(TRANSFEREE_CREDENTIALS_SESSION_KEY, {})
 
     context = {
         'transferee': transferee,
-        'username': username,
-        'password': password,
-        'student_id': student_id,
+        'username': credentials.get('username'),
+        'password': credentials.get('password'),
+        'student_id': credentials.get('student_id'),
     }
     return render(request, 'transferee/transferee_account_details.html', context)
 
@@ -386,11 +446,9 @@ def transferee_credit_subjects(request, pk):
 
             try:
                 with transaction.atomic():
-                    from enrollment.models import StudentSubject, Term
-                    active_term = Term.objects.filter(is_active=True).first()
+                    active_term_id = get_active_term_id()
 
                     # Get previously credited subjects for this student
-                    from enrollment.models import StudentSubject
                     previously_credited = StudentSubject.objects.filter(
                         student=student,
                         status='completed'
@@ -411,32 +469,36 @@ def transferee_credit_subjects(request, pk):
 
                     # Add new subjects that weren't previously credited
                     to_add = new_ids - previous_ids
-                    for subject_id in to_add:
-                        try:
-                            subject = Subject.objects.get(pk=subject_id)
-
-                            if active_term:
-                                StudentSubject.objects.create(
-                                    student=student,
-                                    subject=subject,
-                                    term=active_term,
-                                    status='completed',
-                                )
-
-                                # Log audit trail
-                                AuditTrail.objects.create(
-                                    actor=request.user,
-                                    action='credit_transferee_subject',
-                                    entity='StudentSubject',
-                                    entity_id=subject.id,
-                                    new_value_json={
-                                        'student': student.id,
-                                        'subject': subject.code,
-                                        'status': 'completed',
-                                    }
-                                )
-                        except Subject.DoesNotExist:
-                            continue
+                    if to_add and active_term_id:
+                        # Unknown subject ids are skipped, as before
+                        subjects_to_add = Subject.objects.filter(pk__in=to_add).only('id', 'code')
+
+                        credited_rows = []
+                        audit_rows = []
+                        for subject in subjects_to_add:
+                            credited_rows.append(StudentSubject(
+                                student_id=student.id,
+                                subject_id=subject.id,
+                                term_id=active_term_id,
+                                status='completed',
+                            ))
+                            audit_rows.append(dict(
+                                actor=request.user,
+                                action='credit_transferee_subject',
+                                entity='StudentSubject',
+                                entity_id=subject.id,
+                                new_value_json={
+                                    'student': student.id,
+                                    'subject': subject.code,
+                                    'status': 'completed',
+                                }
+                            ))
+
+                        if credited_rows:
+                            StudentSubject.objects.bulk_create(credited_rows, batch_size=500)
+                            record_audits(audit_rows)
+                            # bulk_create skips post_save, so invalidate cached availability here
+                            bump_grade_version(student.id)
 
                 if to_remove:
                     messages.success(request, f'Updated credited subjects. Removed {len(to_remove)}, added {len(to_add)} subjects.')
@@ -478,7 +540,6 @@ def transferee_credit_subjects(request, pk):
     available_subjects_json = json.dumps(subjects_list)
 
     # Get currently credited subject IDs
-    from enrollment.models import StudentSubject
     credited_subject_ids = list(
         StudentSubject.objects.filter(
             student=student,
@@ -508,15 +569,13 @@ def transferee_finish_enrollment(request, pk):
         return redirect('enrollment:transferee_detail', pk=pk)
 
     # Get credentials from session if available
-    username = request.session.pop('transferee_username', None)
-    password = request.session.pop('transferee_password', None)
-    student_id = request.session.pop('transferee_student_id', None)
+    credentials = request.session.pop(TRANSFEREE_CREDENTIALS_SESSION_KEY, {})
 
     context = {
         'transferee': transferee,
-        'username': username,
-        'password': password,
-        'student_id': student_id,
+        'username': credentials.get('username'),
+        'password': credentials.get('password'),
+        'student_id': credentials.get('student_id'),
     }
     return render(request, 'transferee/transferee_finish_enrollment.html', context)
 
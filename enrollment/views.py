@@ -1,26 +1,38 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib import messages
-from django.db import transaction
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Case, Count, Prefetch, Q, Value, When
 from django.http import JsonResponse
 from users.decorators import role_required
+from academics.models import Subject
 from .models import Term, Section, Student, StudentSubject
+from .cache_utils import (
+    get_active_term_id, get_term_options_version, invalidate_active_term, invalidate_term_options,
+)
+from users.cache_utils import invalidate_dashboard_stats
 from users.models import User
-from audit.models import AuditTrail
+from audit.utils import record_audit, record_audits
 import json
 
 
+# Term level value -> display label, built once for messages
+_LEVEL_MAP = dict(Term.LEVEL_CHOICES)
+
+
 @role_required('registrar')
 def terms_list(request):
     """
     List all non-archived terms with active terms highlighted per level.
     """
-    terms = Term.objects.filter(archived=False).order_by('level', '-start_date')
+    terms = Term.objects.filter(archived=False).only(
+        'id', 'name', 'level', 'start_date', 'end_date', 'add_drop_deadline',
+        'grade_encoding_deadline', 'is_active',
+    ).order_by('level', '-start_date')
 
-    # Get active terms for each level
+    # Get active terms for each level from the already loaded (non-archived) terms
     active_terms = {
-        'SHS': Term.objects.filter(is_active=True, archived=False, level='SHS').first(),
-        'Bachelor': Term.objects.filter(is_active=True, archived=False, level='Bachelor').first(),
-        'Masteral': Term.objects.filter(is_active=True, archived=False, level='Masteral').first(),
+        level: next((term for term in terms if term.level == level and term.is_active), None)
+        for level in ('SHS', 'Bachelor', 'Masteral')
     }
 
     context = {
@@ -64,7 +76,7 @@ def term_create(request):
             return redirect('enrollment:terms_list')
 
         try:
-            # Create term
+            # Create term (name + level is unique)
             term = Term.objects.create(
                 name=name,
                 level=level,
@@ -76,24 +88,20 @@ def term_create(request):
             )
 
             # Audit trail
-            AuditTrail.objects.create(
+            record_audit(
                 actor=request.user,
                 action='create',
                 entity='Term',
                 entity_id=term.id,
-                new_value_json={
-                    'name': term.name,
-                    'level': term.level,
-                    'start_date': str(term.start_date),
-                    'end_date': str(term.end_date),
-                    'add_drop_deadline': str(term.add_drop_deadline) if term.add_drop_deadline else None,
-                    'grade_encoding_deadline': str(term.grade_encoding_deadline) if term.grade_encoding_deadline else None,
-                }
+                new_value_json=term.audit_snapshot(),
             )
 
-            messages.success(request, f'Term "{term.name}" for {term.get_level_display()} created successfully.')
+            messages.success(request, f'Term "{term.name}" for {_LEVEL_MAP.get(term.level, term.level)} created successfully.')
             return redirect('enrollment:terms_list')
 
+        except IntegrityError:
+            messages.error(request, f'Term "{name}" already exists for {_LEVEL_MAP.get(level, level)}.')
+            return redirect('enrollment:terms_list')
         except Exception as e:
             messages.error(request, f'Error creating term: {str(e)}')
             return redirect('enrollment:terms_list')
@@ -112,14 +120,7 @@ def term_update(request, pk):
     term = get_object_or_404(Term, pk=pk)
 
     if request.method == 'POST':
-        old_values = {
-            'name': term.name,
-            'level': term.level,
-            'start_date': str(term.start_date),
-            'end_date': str(term.end_date),
-            'add_drop_deadline': str(term.add_drop_deadline) if term.add_drop_deadline else None,
-            'grade_encoding_deadline': str(term.grade_encoding_deadline) if term.grade_encoding_deadline else None,
-        }
+        old_values = term.audit_snapshot()
 
         # Update fields
         term.name = request.POST.get('name', term.name)
@@ -128,19 +129,12 @@ def term_update(request, pk):
         term.end_date = request.POST.get('end_date', term.end_date)
         term.add_drop_deadline = request.POST.get('add_drop_deadline') or None
         term.grade_encoding_deadline = request.POST.get('grade_encoding_deadline') or None
-        term.save()
+        term.save(update_fields=['name', 'level', 'start_date', 'end_date', 'add_drop_deadline', 'grade_encoding_deadline'])
 
-        new_values = {
-            'name': term.name,
-            'level': term.level,
-            'start_date': str(term.start_date),
-            'end_date': str(term.end_date),
-            'add_drop_deadline': str(term.add_drop_deadline) if term.add_drop_deadline else None,
-            'grade_encoding_deadline': str(term.grade_encoding_deadline) if term.grade_encoding_deadline else None,
-        }
+        new_values = term.audit_snapshot()
 
         # Audit trail
-        AuditTrail.objects.create(
+        record_audit(
             actor=request.user,
             action='update',
             entity='Term',
@@ -171,16 +165,22 @@ def term_activate(request, pk):
             # Get currently active term for this level
             old_active_term = Term.objects.filter(is_active=True, archived=False, level=term.level).first()
 
-            # Deactivate all non-archived terms for this level only
-            Term.objects.filter(level=term.level, archived=False).update(is_active=False)
-
-            # Activate selected term
+            # Activate the selected term and deactivate every other non-archived
+            # term for this level in a single UPDATE
+            Term.objects.filter(Q(level=term.level, archived=False) | Q(pk=term.pk)).update(
+                is_active=Case(When(pk=term.pk, then=Value(True)), default=Value(False))
+            )
             term.is_active = True
-            term.save()
+
+            # update() skips post_save, so drop the cached term data and the
+            # dashboard counts (active terms) here
+            transaction.on_commit(invalidate_active_term)
+            transaction.on_commit(invalidate_term_options)
+            transaction.on_commit(invalidate_dashboard_stats)
 
             # Audit trail for deactivation
             if old_active_term and old_active_term.id != term.id:
-                AuditTrail.objects.create(
+                record_audit(
                     actor=request.user,
                     action='deactivate',
                     entity='Term',
@@ -190,7 +190,7 @@ def term_activate(request, pk):
                 )
 
             # Audit trail for activation
-            AuditTrail.objects.create(
+            record_audit(
                 actor=request.user,
                 action='activate',
                 entity='Term',
@@ -220,10 +220,10 @@ def term_close(request, pk):
 
         # Close term
         term.is_active = False
-        term.save()
+        term.save(update_fields=['is_active'])
 
         # Audit trail
-        AuditTrail.objects.create(
+        record_audit(
             actor=request.user,
             action='close',
             entity='Term',
@@ -259,7 +259,7 @@ def term_delete(request, pk):
         term_id = term.id
 
         # Audit trail
-        AuditTrail.objects.create(
+        record_audit(
             actor=request.user,
             action='delete',
             entity='Term',
@@ -299,10 +299,10 @@ def term_archive(request, pk):
 
         # Archive the term
         term.archived = True
-        term.save()
+        term.save(update_fields=['is_active', 'archived'])
 
         # Audit trail
-        AuditTrail.objects.create(
+        record_audit(
             actor=request.user,
             action='archive',
             entity='Term',
@@ -332,10 +332,10 @@ def term_unarchive(request, pk):
 
         # Unarchive the term
         term.archived = False
-        term.save()
+        term.save(update_fields=['archived'])
 
         # Audit trail
-        AuditTrail.objects.create(
+        record_audit(
             actor=request.user,
             action='unarchive',
             entity='Term',
@@ -355,19 +355,42 @@ def term_unarchive(request, pk):
 
 # ==================== SECTION MANAGEMENT ====================
 
+def _sync_section_links(through, section, field, current_ids, new_ids):
+    """
+    Bring a section's M2M through rows from current_ids to new_ids with at most
+    one DELETE and one multi-row INSERT.
+    """
+    removed = current_ids - new_ids
+    added = new_ids - current_ids
+    if removed:
+        through.objects.filter(section_id=section.id, **{f'{field}__in': removed}).delete()
+    if added:
+        through.objects.bulk_create(
+            [through(section_id=section.id, **{field: pk}) for pk in added],
+            ignore_conflicts=True,
+        )
+
+
 @role_required('registrar')
 def sections_list(request):
     """
     List all sections with filtering by term and optimized queries for multi-select fields.
     """
-    from academics.models import Subject
-
-    # Get active term or allow selection
-    active_term = Term.objects.filter(is_active=True).first()
+    # Get active term or allow selection. The term dropdown is a cached template
+    # fragment, so the terms queryset is only evaluated on a fragment cache miss.
+    terms = Term.objects.only('id', 'name', 'is_active').order_by('-start_date')
+    active_term_id = get_active_term_id()
+    active_term = Term.objects.only('id', 'name').filter(pk=active_term_id).first() if active_term_id else None
     selected_term_id = request.GET.get('term', active_term.id if active_term else None)
 
-    terms = Term.objects.all().order_by('-start_date')
-    sections = Section.objects.all().prefetch_related('subjects', 'professors').select_related('term')
+    # Constant query count: term joined, M2Ms prefetched with only the columns the
+    # table renders, and enrolled counts annotated instead of counted per row
+    sections = Section.objects.select_related('term').prefetch_related(
+        Prefetch('subjects', queryset=Subject.objects.only('id', 'code', 'title')),
+        Prefetch('professors', queryset=User.objects.only('id', 'first_name', 'last_name', 'username', 'email')),
+    ).annotate(
+        enrolled_total=Count('studentsubject', filter=Q(studentsubject__status='enrolled'))
+    ).only('id', 'section_code', 'capacity', 'status', 'created_at', 'term', 'term__name')
 
     if selected_term_id:
         sections = sections.filter(term_id=selected_term_id)
@@ -379,6 +402,7 @@ def sections_list(request):
         'terms': terms,
         'selected_term_id': int(selected_term_id) if selected_term_id else None,
         'active_term': active_term,
+        'term_options_version': get_term_options_version(),
     }
 
     # Check if this is an HTMX request for the content only
@@ -400,8 +424,12 @@ def section_create(request):
         subject_ids = request.POST.getlist('subjects[]')
         term_id = request.POST.get('term_id')
         section_code = request.POST.get('section_code')
-        capacity = request.POST.get('capacity', 40)
         professor_ids = request.POST.getlist('professors[]')
+        try:
+            capacity = int(request.POST.get('capacity') or 40)
+        except ValueError:
+            messages.error(request, 'Capacity must be a whole number.')
+            return redirect('enrollment:sections_list')
 
         # Validation
         if not all([program_id, subject_ids, term_id, section_code]):
@@ -418,32 +446,36 @@ def section_create(request):
                 messages.error(request, 'Some selected subjects do not belong to the selected program.')
                 return redirect('enrollment:sections_list')
 
-            # Check for duplicate section code in term
-            if Section.objects.filter(term=term, section_code=section_code).exists():
+            # Create section with its subjects and professors in one transaction;
+            # a duplicate section code in the term is rejected by the unique constraint
+            try:
+                with transaction.atomic():
+                    section = Section.objects.create(
+                        term=term,
+                        section_code=section_code,
+                        capacity=capacity,
+                        status='open',
+                    )
+
+                    # Add subjects and professors to the new section in bulk
+                    professors = []
+                    if professor_ids:
+                        professors = list(User.objects.filter(id__in=professor_ids, role='professor'))
+                    _sync_section_links(
+                        Section.subjects.through, section, 'subject_id', set(), {s.id for s in subjects}
+                    )
+                    _sync_section_links(
+                        Section.professors.through, section, 'user_id', set(), {p.id for p in professors}
+                    )
+            except IntegrityError:
                 messages.error(request, f'Section {section_code} already exists for {term.name}.')
                 return redirect('enrollment:sections_list')
 
-            # Create section
-            section = Section.objects.create(
-                term=term,
-                section_code=section_code,
-                capacity=capacity,
-                status='open',
-            )
-
-            # Add subjects to section
-            section.subjects.set(subjects)
-
-            # Add professors to section
-            if professor_ids:
-                professors = User.objects.filter(id__in=professor_ids, role='professor')
-                section.professors.set(professors)
-
             # Audit trail
             subject_codes = ', '.join([s.code for s in subjects])
-            professor_names = ', '.join([p.get_full_name() or p.username for p in section.professors.all()])
+            professor_names = ', '.join([p.get_full_name() or p.username for p in professors])
 
-            AuditTrail.objects.create(
+            record_audit(
                 actor=request.user,
                 action='create',
                 entity='Section',
@@ -465,13 +497,10 @@ def section_create(request):
             messages.error(request, f'Error creating section: {str(e)}')
             return redirect('enrollment:sections_list')
 
-    # GET request - show form
-    terms = Term.objects.all().order_by('-start_date')
-    active_term = Term.objects.filter(is_active=True).first()
-
+    # GET request - show form (terms are only loaded on a fragment cache miss)
     context = {
-        'terms': terms,
-        'active_term': active_term,
+        'terms': Term.objects.only('id', 'name', 'is_active').order_by('-start_date'),
+        'term_options_version': get_term_options_version(),
     }
     return render(request, 'registrar/sections/section_form.html', context)
 
@@ -481,11 +510,19 @@ def section_update(request, pk):
     """
     Update an existing section with multiple subjects and professors.
     """
-    section = get_object_or_404(Section, pk=pk)
+    section = get_object_or_404(
+        Section.objects.select_related('term').prefetch_related(
+            Prefetch('subjects', queryset=Subject.objects.select_related('program')),
+            'professors',
+        ),
+        pk=pk,
+    )
 
     if request.method == 'POST':
         old_subjects = ', '.join([s.code for s in section.subjects.all()])
         old_professors = ', '.join([p.get_full_name() or p.username for p in section.professors.all()])
+        subjects = list(section.subjects.all())
+        old_professor_ids = {p.id for p in section.professors.all()}
 
         old_values = {
             'section_code': section.section_code,
@@ -495,27 +532,42 @@ def section_update(request, pk):
             'status': section.status,
         }
 
+        try:
+            capacity = int(request.POST.get('capacity') or section.capacity)
+        except ValueError:
+            messages.error(request, 'Capacity must be a whole number.')
+            return redirect('enrollment:sections_list')
+
         # Update fields
         section.section_code = request.POST.get('section_code', section.section_code)
-        section.capacity = request.POST.get('capacity', section.capacity)
+        section.capacity = capacity
 
-        # Update subjects
+        # Resolve the new subjects (kept as-is when none are posted) and professors
         subject_ids = request.POST.getlist('subjects[]')
+        old_subject_ids = {s.id for s in subjects}
         if subject_ids:
-            subjects = section.subjects.model.objects.filter(id__in=subject_ids)
-            section.subjects.set(subjects)
+            subjects = list(Subject.objects.filter(id__in=subject_ids))
 
-        # Update professors
         professor_ids = request.POST.getlist('professors[]')
-        section.professors.clear()
+        professors = []
         if professor_ids:
-            professors = User.objects.filter(id__in=professor_ids, role='professor')
-            section.professors.set(professors)
+            professors = list(User.objects.filter(id__in=professor_ids, role='professor'))
 
-        section.save()
+        # Only delete removed links and insert added ones
+        with transaction.atomic():
+            section.save(update_fields=['section_code', 'capacity'])
+            _sync_section_links(
+                Section.subjects.through, section, 'subject_id',
+                old_subject_ids, {s.id for s in subjects},
+            )
+            _sync_section_links(
+                Section.professors.through, section, 'user_id',
+                old_professor_ids, {p.id for p in professors},
+            )
 
-        new_subjects = ', '.join([s.code for s in section.subjects.all()])
-        new_professors = ', '.join([p.get_full_name() or p.username for p in section.professors.all()])
+        # Reuse the lists just assigned instead of re-reading the M2M tables
+        new_subjects = ', '.join([s.code for s in subjects])
+        new_professors = ', '.join([p.get_full_name() or p.username for p in professors])
 
         new_values = {
             'section_code': section.section_code,
@@ -526,7 +578,7 @@ def section_update(request, pk):
         }
 
         # Audit trail
-        AuditTrail.objects.create(
+        record_audit(
             actor=request.user,
             action='update',
             entity='Section',
@@ -538,12 +590,11 @@ def section_update(request, pk):
         messages.success(request, f'Section {section.section_code} updated successfully.')
         return redirect('enrollment:sections_list')
 
-    # Get terms for the form
-    terms = Term.objects.all().order_by('-start_date')
-
+    # Get terms for the form (only loaded on a fragment cache miss)
     context = {
         'section': section,
-        'terms': terms,
+        'terms': Term.objects.only('id', 'name', 'is_active').order_by('-start_date'),
+        'term_options_version': get_term_options_version(),
     }
     return render(request, 'registrar/sections/section_form.html', context)
 
@@ -553,7 +604,9 @@ def section_delete(request, pk):
     """
     Delete a section (only if no students enrolled).
     """
-    section = get_object_or_404(Section, pk=pk)
+    section = get_object_or_404(
+        Section.objects.select_related('term').prefetch_related('subjects'), pk=pk
+    )
 
     if request.method == 'POST':
         # Check if section has enrolled students
@@ -566,14 +619,14 @@ def section_delete(request, pk):
         section_id = section.id
 
         # Audit trail
-        AuditTrail.objects.create(
+        record_audit(
             actor=request.user,
             action='delete',
             entity='Section',
             entity_id=section_id,
             old_value_json={
                 'section_code': section.section_code,
-                'subject': section.subject.code,
+                'subjects': ', '.join(s.code for s in section.subjects.all()),
                 'term': section.term.name,
             },
         )
@@ -606,10 +659,10 @@ def section_change_status(request, pk):
 
         old_status = section.status
         section.status = new_status
-        section.save()
+        section.save(update_fields=['status'])
 
         # Audit trail
-        AuditTrail.objects.create(
+        record_audit(
             actor=request.user,
             action='change_status',
             entity='Section',
@@ -634,9 +687,13 @@ def sections_bulk_create(request):
     if request.method == 'POST':
         subject_id = request.POST.get('subject_id')
         term_id = request.POST.get('term_id')
-        num_sections = int(request.POST.get('num_sections', 1))
-        capacity = int(request.POST.get('capacity', 40))
         professor_id = request.POST.get('professor_id')
+        try:
+            num_sections = int(request.POST.get('num_sections') or 1)
+            capacity = int(request.POST.get('capacity') or 40)
+        except ValueError:
+            messages.error(request, 'Number of sections and capacity must be whole numbers.')
+            return redirect('enrollment:sections_list')
 
         if not all([subject_id, term_id, num_sections]):
             messages.error(request, 'Subject, Term, and Number of Sections are required.')
@@ -649,41 +706,68 @@ def sections_bulk_create(request):
 
             # Generate section codes (A, B, C, ...)
             import string
-            letters = string.ascii_uppercase
-            created_count = 0
-
-            for i in range(num_sections):
-                if i < len(letters):
-                    section_code = f"{subject.code}-{letters[i]}"
-
-                    # Check if exists
-                    if Section.objects.filter(subject=subject, term=term, section_code=section_code).exists():
-                        continue
-
-                    # Create section
-                    section = Section.objects.create(
-                        subject=subject,
-                        term=term,
-                        section_code=section_code,
-                        capacity=capacity,
-                        professor=professor if professor else User.objects.filter(role='professor').first(),
-                        status='open',
-                    )
+            candidate_codes = [
+                f"{subject.code}-{letter}" for letter in string.ascii_uppercase[:num_sections]
+            ]
+
+            # Skip codes that already exist in this term (one query for all candidates)
+            existing_codes = set(
+                Section.objects.filter(
+                    term=term, section_code__in=candidate_codes
+                ).values_list('section_code', flat=True)
+            )
+            new_codes = [code for code in candidate_codes if code not in existing_codes]
+
+            if professor is None:
+                professor = User.objects.filter(role='professor').first()
+
+            # The unique (term, section_code) constraint rejects codes created
+            # by another request after the lookup above
+            try:
+                with transaction.atomic():
+                    created_sections = Section.objects.bulk_create([
+                        Section(
+                            term=term,
+                            section_code=section_code,
+                            capacity=capacity,
+                            status='open',
+                        )
+                        for section_code in new_codes
+                    ])
+
+                    # Link subject and professor through the M2M tables in bulk
+                    SectionSubject = Section.subjects.through
+                    SectionSubject.objects.bulk_create([
+                        SectionSubject(section_id=section.id, subject_id=subject.id)
+                        for section in created_sections
+                    ])
+                    if professor:
+                        SectionProfessor = Section.professors.through
+                        SectionProfessor.objects.bulk_create([
+                            SectionProfessor(section_id=section.id, user_id=professor.id)
+                            for section in created_sections
+                        ])
 
                     # Audit trail
-                    AuditTrail.objects.create(
-                        actor=request.user,
-                        action='bulk_create',
-                        entity='Section',
-                        entity_id=section.id,
-                        new_value_json={
-                            'section_code': section_code,
-                            'subject': subject.code,
-                            'term': term.name,
-                        }
+                    record_audits(
+                        dict(
+                            actor=request.user,
+                            action='bulk_create',
+                            entity='Section',
+                            entity_id=section.id,
+                            new_value_json={
+                                'section_code': section.section_code,
+                                'subject': subject.code,
+                                'term': term.name,
+                            }
+                        )
+                        for section in created_sections
                     )
+            except IntegrityError:
+                messages.error(request, 'Some of these sections were just created elsewhere. Please try again.')
+                return redirect('enrollment:sections_list')
 
-                    created_count += 1
+            created_count = len(created_sections)
 
             messages.success(request, f'Created {created_count} sections for {subject.code}.')
             return redirect('enrollment:sections_list')
@@ -692,12 +776,10 @@ def sections_bulk_create(request):
             messages.error(request, f'Error creating sections: {str(e)}')
             return redirect('enrollment:sections_list')
 
-    terms = Term.objects.all().order_by('-start_date')
-    active_term = Term.objects.filter(is_active=True).first()
-
+    # Terms are only loaded on a fragment cache miss
     context = {
-        'terms': terms,
-        'active_term': active_term,
+        'terms': Term.objects.only('id', 'name', 'is_active').order_by('-start_date'),
+        'term_options_version': get_term_options_version(),
     }
     return render(request, 'registrar/sections/bulk_create_form.html', context)
 
@@ -713,13 +795,26 @@ def professor_search(request):
         return JsonResponse({'results': []})
 
     # Search professors by name or username
-    professors = User.objects.filter(
-        role='professor'
-    ).filter(
-        models.Q(first_name__icontains=query) |
-        models.Q(last_name__icontains=query) |
-        models.Q(username__icontains=query)
-    )[:10]
+    professors = User.objects.filter(role='professor').only(
+        'id', 'first_name', 'last_name', 'username', 'email'
+    )
+    search_filter = (
+        Q(first_name__icontains=query) |
+        Q(last_name__icontains=query) |
+        Q(username__icontains=query)
+    )
+    if connection.vendor == 'postgresql':
+        # Served by the user_prof_trgm GIN index; ranks closest matches first
+        from django.contrib.postgres.search import TrigramSimilarity
+        professors = professors.annotate(
+            similarity=(
+                TrigramSimilarity('first_name', query) +
+                TrigramSimilarity('last_name', query) +
+                TrigramSimilarity('username', query)
+            )
+        ).filter(search_filter | Q(similarity__gt=0.1)).order_by('-similarity')
+    else:
+        professors = professors.filter(search_filter)
 
     results = [
         {
@@ -728,7 +823,7 @@ def professor_search(request):
             'username': prof.username,
             'email': prof.email,
         }
-        for prof in professors
+        for prof in professors[:10]
     ]
 
     return JsonResponse({'results': results})
@@ -0,0 +1,59 @@
+from decimal import Decimal, InvalidOperation
+
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from enrollment.cache_utils import bump_grade_version
+from enrollment.models import StudentSubject
+from .models import Grade
+
+
+def _bump_for_student_subject(student_subject_id):
+    """Invalidate cached availability data for the student owning a StudentSubject."""
+    student_id = StudentSubject.objects.filter(
+        pk=student_subject_id
+    ).values_list('student_id', flat=True).first()
+    if student_id is not None:
+        bump_grade_version(student_id)
+
+
+def _grade_to_decimal(grade):
+    """
+    Convert a posted grade string to a Decimal that fits StudentSubject.latest_grade,
+    or None if it is not a finite number or would overflow the column.
+    """
+    field = StudentSubject._meta.get_field('latest_grade')
+    try:
+        value = Decimal(grade)
+        if not value.is_finite():
+            return None
+        value = value.quantize(Decimal(10) ** -field.decimal_places)
+    except (InvalidOperation, TypeError):
+        return None
+    if abs(value) >= Decimal(10) ** (field.max_digits - field.decimal_places):
+        return None
+    return value
+
+
+def _sync_latest_grade(student_subject_id):
+    """Store the most recently posted grade (or None) on StudentSubject.latest_grade."""
+    latest = Grade.objects.filter(
+        student_subject_id=student_subject_id
+    ).order_by('-posted_at', '-id').values_list('grade', flat=True).first()
+
+    StudentSubject.objects.filter(pk=student_subject_id).update(
+        latest_grade=_grade_to_decimal(latest)
+    )
+    _bump_for_student_subject(student_subject_id)
+
+
+@receiver(post_save, sender=Grade)
+def sync_latest_grade_on_save(sender, instance, **kwargs):
+    """Recompute latest_grade; editing an older grade must not replace a newer one."""
+    _sync_latest_grade(instance.student_subject_id)
+
+
+@receiver(post_delete, sender=Grade)
+def sync_latest_grade_on_delete(sender, instance, **kwargs):
+    """Fall back to the most recent remaining grade (or None) when a grade is deleted."""
+    _sync_latest_grade(instance.student_subject_id)
@@ -0,0 +1,9 @@
+"""
+Django settings for running the richwell_portal test suite.
+"""
+
+from .settings import *  # noqa: F401,F403
+
+# Tests only need passwords to round-trip; the default PBKDF2 hasher makes
+# every create_user() and client.login() spend most of its time hashing.
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
@@ -0,0 +1,55 @@
+"""
+Cache helpers for system settings.
+Uses Django's cache framework (configured via settings.CACHES).
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import Setting
+
+
+ENROLLMENT_OPEN_KEY = 'enrollment_open'
+ENROLLMENT_OPEN_CACHE_KEY = f'setting:{ENROLLMENT_OPEN_KEY}'
+
+# Backends whose entries live in a single process. The signals only refresh
+# the copy in the process that saved the setting, so with these the cached
+# flag must expire for other workers to see a toggle.
+PROCESS_LOCAL_CACHE_BACKENDS = frozenset({
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+})
+
+# Never expire on a shared cache (the signals keep it current); a minute otherwise
+SETTING_CACHE_TTL = (
+    60 if settings.CACHES['default']['BACKEND'] in PROCESS_LOCAL_CACHE_BACKENDS else None
+)
+
+
+def is_enrollment_open():
+    """
+    Check the enrollment_open flag.
+    The database row is the durable value; the cache copy is refreshed by the
+    Setting signals in settingsapp.signals and kept for SETTING_CACHE_TTL.
+    """
+    value = cache.get(ENROLLMENT_OPEN_CACHE_KEY)
+    if value is None:
+        value = (
+            Setting.objects.filter(key_name=ENROLLMENT_OPEN_KEY)
+            .values_list('value_text', flat=True)
+            .first()
+        ) or 'false'
+        cache.set(ENROLLMENT_OPEN_CACHE_KEY, value, SETTING_CACHE_TTL)
+    return value.lower() == 'true'
+
+
+def refresh_setting_cache(setting):
+    """Write a changed setting through to its cache copy."""
+    if setting.key_name == ENROLLMENT_OPEN_KEY:
+        cache.set(ENROLLMENT_OPEN_CACHE_KEY, setting.value_text, SETTING_CACHE_TTL)
+
+
+def invalidate_setting_cache(setting):
+    """Drop the cache copy of a deleted setting."""
+    if setting.key_name == ENROLLMENT_OPEN_KEY:
+        cache.delete(ENROLLMENT_OPEN_CACHE_KEY)
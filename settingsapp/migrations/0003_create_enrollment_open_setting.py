@@ -0,0 +1,23 @@
+from django.db import migrations
+
+
+def create_enrollment_open(apps, schema_editor):
+    Setting = apps.get_model('settingsapp', 'Setting')
+    Setting.objects.get_or_create(
+        key_name='enrollment_open',
+        defaults={
+            'value_text': 'false',
+            'description': 'Toggle to enable or disable student enrollment',
+        }
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('settingsapp', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_enrollment_open, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .cache_utils import invalidate_setting_cache, refresh_setting_cache
+from .models import Setting
+
+
+@receiver(post_save, sender=Setting)
+def update_setting_cache(sender, instance, **kwargs):
+    """Write the new value to the cache once the change is committed."""
+    transaction.on_commit(lambda: refresh_setting_cache(instance))
+
+
+@receiver(post_delete, sender=Setting)
+def delete_setting_cache(sender, instance, **kwargs):
+    """Drop the cached value once the delete is committed."""
+    transaction.on_commit(lambda: invalidate_setting_cache(instance))
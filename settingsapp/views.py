@@ -3,7 +3,8 @@ from django.contrib import messages
 from django.http import JsonResponse
 from users.decorators import role_required
 from .models import Setting
-from audit.models import AuditTrail
+from .cache_utils import ENROLLMENT_OPEN_KEY
+from audit.utils import record_audit
 
 
 @role_required('registrar', 'admin')
@@ -11,16 +12,11 @@ def settings_list(request):
     """
     List all system settings.
     """
-    settings = Setting.objects.all().order_by('key_name')
-
-    # Get or create enrollment_open setting if it doesn't exist
-    enrollment_open, created = Setting.objects.get_or_create(
-        key_name='enrollment_open',
-        defaults={
-            'value_text': 'false',
-            'description': 'Toggle to enable or disable student enrollment',
-            'updated_by': request.user,
-        }
+    settings = Setting.objects.select_related('updated_by').order_by('key_name')
+
+    # enrollment_open is created by a data migration; pick it from the loaded list
+    enrollment_open = next(
+        (setting for setting in settings if setting.key_name == ENROLLMENT_OPEN_KEY), None
     )
 
     context = {
@@ -44,10 +40,10 @@ def setting_update(request, pk):
         setting.value_text = request.POST.get('value_text', setting.value_text)
         setting.description = request.POST.get('description', setting.description)
         setting.updated_by = request.user
-        setting.save()
+        setting.save(update_fields=['value_text', 'description', 'updated_by', 'updated_at'])
 
         # Audit trail
-        AuditTrail.objects.create(
+        record_audit(
             actor=request.user,
             action='update',
             entity='Setting',
@@ -81,10 +77,10 @@ def setting_toggle(request, key):
             setting.value_text = 'true'
 
         setting.updated_by = request.user
-        setting.save()
+        setting.save(update_fields=['value_text', 'updated_by', 'updated_at'])
 
         # Audit trail
-        AuditTrail.objects.create(
+        record_audit(
             actor=request.user,
             action='toggle',
             entity='Setting',
@@ -0,0 +1,5 @@
+"""
+pytest configuration for the portal test suite.
+pytest-django registers itself through its entry point; DJANGO_SETTINGS_MODULE is set in pytest.ini.
+Seed data is created once per TestCase class in setUpTestData (see tests/utils.py).
+"""
@@ -0,0 +1,47 @@
+"""
+Tests for the student account settings page.
+"""
+from django.test import TestCase
+
+from .utils import PASSWORD, create_user
+
+
+class ChangePasswordTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.student = create_user('student')
+
+    def setUp(self):
+        self.client.force_login(self.student)
+
+    def change_password(self, new_password):
+        return self.client.post('/account-settings/', {
+            'action': 'change_password',
+            'current_password': PASSWORD,
+            'new_password': new_password,
+            'confirm_password': new_password,
+        })
+
+    def assert_rejected(self, new_password, message):
+        response = self.change_password(new_password)
+        self.assertContains(response, message)
+        self.student.refresh_from_db()
+        assert self.student.check_password(PASSWORD), "Password hash changed despite the error"
+
+    def test_short_password_is_rejected(self):
+        self.assert_rejected('x7#kq', 'This password is too short.')
+
+    def test_common_password_is_rejected(self):
+        self.assert_rejected('password', 'This password is too common.')
+
+    def test_valid_password_is_changed_and_keeps_session(self):
+        response = self.change_password('Tr1cky-Quokka-42')
+        self.assertRedirects(response, '/account-settings/')
+
+        self.student.refresh_from_db()
+        assert self.student.check_password('Tr1cky-Quokka-42')
+
+        # The session hash was updated, so the student is still logged in
+        response = self.client.get('/account-settings/')
+        assert response.status_code == 200
@@ -0,0 +1,26 @@
+"""
+Tests for the registrar AJAX search endpoints.
+"""
+from .utils import RegistrarTestCase, create_user
+
+
+class AjaxTests(RegistrarTestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        create_user('professor', first_name='Prof', last_name='Santos')
+
+    def test_ajax_endpoints(self):
+        """Test AJAX endpoints."""
+        response = self.client.get('/registrar/enrollment/professors/search/', {'q': 'prof'})
+        assert response.status_code == 200, "Professor search endpoint"
+
+        data = response.json()
+        assert 'results' in data, "Professor search returns results"
+
+        response = self.client.get('/registrar/academics/subjects/search/', {'q': 'IT'})
+        assert response.status_code == 200, "Subject search endpoint"
+
+        data = response.json()
+        assert 'results' in data, "Subject search returns results"
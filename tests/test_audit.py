@@ -0,0 +1,110 @@
+"""
+Tests for audit trail recording.
+"""
+from django.db import transaction
+from django.test import TestCase, TransactionTestCase
+
+from audit.models import AuditTrail
+from audit.utils import _coalesce, audit_buffer, record_audit, record_audits
+
+from .utils import PASSWORD, create_user
+
+
+class AuditMiddlewareTests(TransactionTestCase):
+    """
+    Runs with real commits so record_audit's on_commit callback fires inside
+    the request and the row goes through the middleware's buffer.
+    """
+
+    def setUp(self):
+        self.student = create_user('student')
+        self.client.force_login(self.student)
+
+    def test_rows_recorded_during_request_are_written(self):
+        response = self.client.post('/account-settings/', {
+            'action': 'change_username',
+            'new_username': 'renamed',
+            'confirm_password': PASSWORD,
+        })
+        assert response.status_code == 302
+
+        row = AuditTrail.objects.get()
+        assert row.actor == self.student
+        assert row.action == 'change_username'
+        assert row.new_value_json == {'old_username': 'student', 'new_username': 'renamed'}
+
+
+class RecordAuditTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.registrar = create_user('registrar')
+
+    def record(self, entity_id, old=None, new=None):
+        record_audit(
+            actor=self.registrar, action='update', entity='Subject', entity_id=entity_id,
+            old_value_json=old, new_value_json=new,
+        )
+
+    def test_unbuffered_row_is_written_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.record(1)
+            assert not AuditTrail.objects.exists(), "Row written before commit"
+        assert AuditTrail.objects.get().entity_id == 1
+
+    def test_rolled_back_row_is_not_written(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            try:
+                with transaction.atomic():
+                    self.record(1)
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+        assert callbacks == []
+        assert not AuditTrail.objects.exists()
+
+    def test_buffered_rows_are_written_in_one_bulk_create(self):
+        with self.assertNumQueries(1):
+            with audit_buffer() as rows:
+                with self.captureOnCommitCallbacks(execute=True):
+                    self.record(1)
+                    self.record(2)
+                assert len(rows) == 2
+        assert sorted(AuditTrail.objects.values_list('entity_id', flat=True)) == [1, 2]
+
+    def test_buffered_rows_for_the_same_entity_are_coalesced(self):
+        with audit_buffer():
+            with self.captureOnCommitCallbacks(execute=True):
+                self.record(1, old={'units': 3}, new={'units': 4})
+                self.record(1, old={'units': 4}, new={'units': 5})
+        row = AuditTrail.objects.get()
+        assert row.old_value_json == {'units': 3}
+        assert row.new_value_json == {'units': 5}
+
+    def test_record_audits_buffers_and_coalesces(self):
+        rows = [
+            dict(actor=self.registrar, action='update', entity='Subject', entity_id=1, new_value_json={'units': units})
+            for units in (4, 5)
+        ]
+        with self.assertNumQueries(1):
+            with audit_buffer():
+                with self.captureOnCommitCallbacks(execute=True):
+                    record_audits(rows)
+        assert AuditTrail.objects.get().new_value_json == {'units': 5}
+
+    def test_record_audits_rolled_back_rows_are_not_written(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    record_audits([dict(actor=self.registrar, action='bulk_create', entity='Section', entity_id=1)])
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+        assert not AuditTrail.objects.exists()
+
+    def test_coalesce_keeps_rows_without_entity_id(self):
+        rows = [
+            AuditTrail(actor=self.registrar, action='login', entity='User', entity_id=None)
+            for _ in range(2)
+        ]
+        assert _coalesce(rows) == rows
@@ -0,0 +1,52 @@
+"""
+Tests for registrar authentication and role-based access.
+"""
+from enrollment.models import Student
+
+from .utils import PASSWORD, RegistrarTestCase, create_enrollment_setting, create_user, users_by_role
+
+
+class AuthTests(RegistrarTestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.professor = create_user('professor')
+        cls.student_user = create_user('student')
+        create_enrollment_setting()
+
+    def test_user_roles(self):
+        """Test that users with different roles exist."""
+        users = users_by_role('registrar', 'professor', 'student')
+        assert 'registrar' in users, "Registrar user exists"
+        assert 'professor' in users, "Professor user exists"
+        assert 'student' in users, "Student user exists"
+        assert Student.objects.filter(user=users['student']).first() is not None, "Student profile exists"
+
+    def test_authentication(self):
+        """Test login and role-based access."""
+        self.client.logout()
+
+        response = self.client.get('/login/')
+        assert response.status_code == 200, "Login page accessible"
+
+        assert self.client.login(username=self.registrar.username, password=PASSWORD), "Registrar can login"
+
+        response = self.client.get('/dashboard/registrar/')
+        assert response.status_code == 200, "Registrar can access registrar dashboard"
+
+        response = self.client.get('/registrar/academics/')
+        assert response.status_code == 200, "Registrar can access academics module"
+
+        response = self.client.get('/registrar/enrollment/terms/')
+        assert response.status_code == 200, "Registrar can access terms module"
+
+        response = self.client.get('/registrar/settings/')
+        assert response.status_code == 200, "Registrar can access settings module"
+
+        self.client.logout()
+
+        # Students cannot reach registrar pages
+        self.client.force_login(self.student_user)
+        response = self.client.get('/registrar/academics/')
+        assert response.status_code == 403, "Student cannot access registrar pages"
@@ -0,0 +1,48 @@
+"""
+Tests for registrar curriculum management.
+"""
+from academics.models import Curriculum, CurriculumSubject, Subject
+
+from .utils import RegistrarTestCase, create_program
+
+
+class CurriculumTests(RegistrarTestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.program = create_program()
+
+    def test_curricula_management(self):
+        """Test Curriculum CRUD and special features."""
+        subjects = Subject.objects.bulk_create([
+            Subject(program=self.program, code='IT101', title='Introduction to Programming', units=3),
+            Subject(program=self.program, code='IT102', title='Data Structures', units=3),
+        ])
+
+        response = self.client.post('/registrar/academics/curricula/create/', {
+            'program_id': self.program.id,
+            'version': '2024',
+            'effective_sy': '2024-2025',
+        })
+        assert response.status_code == 200, "Create curriculum"
+
+        curriculum = Curriculum.objects.filter(program=self.program, version='2024').first()
+        assert curriculum is not None, "Curriculum exists"
+
+        CurriculumSubject.objects.bulk_create([
+            CurriculumSubject(curriculum=curriculum, subject=subject, year_level=1, term_no=1, is_recommended=True)
+            for subject in subjects
+        ])
+        assert CurriculumSubject.objects.filter(curriculum=curriculum).count() == 2, "Add subjects to curriculum"
+
+        response = self.client.post(f'/registrar/academics/curricula/{curriculum.id}/duplicate/', {
+            'new_version': '2025',
+            'new_effective_sy': '2025-2026',
+        })
+        assert response.status_code == 200, "Duplicate curriculum"
+
+        dup_curriculum = Curriculum.objects.filter(program=self.program, version='2025').first()
+        assert dup_curriculum is not None, "Duplicated curriculum exists"
+        assert CurriculumSubject.objects.filter(curriculum=dup_curriculum).count() == 2, \
+            "Duplicated curriculum has subjects"
@@ -0,0 +1,49 @@
+"""
+Tests for conditional GETs on the cached dashboards.
+"""
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from .utils import PASSWORD, create_user
+
+
+class DashboardETagTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = create_user('admin')
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.admin)
+
+    def get_dashboard(self, etag=None):
+        headers = {'If-None-Match': etag} if etag else {}
+        return self.client.get('/dashboard/admin/', headers=headers)
+
+    def test_unchanged_dashboard_is_not_modified(self):
+        response = self.get_dashboard()
+        assert response.status_code == 200
+        assert response.has_header('ETag')
+
+        response = self.get_dashboard(response['ETag'])
+        assert response.status_code == 304
+
+    def test_pending_messages_force_full_response(self):
+        etag = self.get_dashboard()['ETag']
+
+        # Logging in queues a welcome message for the next page
+        self.client.logout()
+        self.client.post('/login/', {'username': self.admin.username, 'password': PASSWORD})
+
+        response = self.get_dashboard(etag)
+        assert response.status_code == 200
+        assert b'Welcome back' in response.content
+
+    def test_release_version_changes_etag(self):
+        etag = self.get_dashboard()['ETag']
+
+        with override_settings(DASHBOARD_ETAG_VERSION=2):
+            response = self.get_dashboard(etag)
+        assert response.status_code == 200
+        assert response['ETag'] != etag
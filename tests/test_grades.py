@@ -0,0 +1,91 @@
+"""
+Tests for keeping StudentSubject.latest_grade in sync with posted grades.
+"""
+from decimal import Decimal
+from importlib import import_module
+
+from django.apps import apps
+from django.test import TestCase
+
+from academics.models import Subject
+from enrollment.models import StudentSubject
+from grades.models import Grade
+from grades.signals import _grade_to_decimal
+
+from .utils import create_program, create_term, create_user
+
+
+class LatestGradeTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.professor = create_user('professor')
+        student = create_user('student').student
+        cls.subject = Subject.objects.create(
+            program=create_program(), code='IT101', title='Introduction to Programming', units=3
+        )
+        cls.student_subject = StudentSubject.objects.create(
+            student=student, subject=cls.subject, term=create_term(), status='completed'
+        )
+
+    def post_grade(self, grade):
+        return Grade.objects.create(
+            student_subject=self.student_subject, subject=self.subject, professor=self.professor, grade=grade
+        )
+
+    def latest_grade(self):
+        self.student_subject.refresh_from_db(fields=['latest_grade'])
+        return self.student_subject.latest_grade
+
+    def test_posted_grade_is_synced(self):
+        self.post_grade('2.00')
+        assert self.latest_grade() == Decimal('2.00')
+
+        self.post_grade('1.50')
+        assert self.latest_grade() == Decimal('1.50'), "Newest grade wins"
+
+    def test_editing_older_grade_keeps_newest(self):
+        first = self.post_grade('2.00')
+        self.post_grade('1.50')
+
+        first.grade = '3.00'
+        first.save()
+        assert self.latest_grade() == Decimal('1.50')
+
+    def test_delete_falls_back_to_previous_grade(self):
+        first = self.post_grade('2.00')
+        second = self.post_grade('1.50')
+
+        second.delete()
+        assert self.latest_grade() == Decimal('2.00')
+
+        first.delete()
+        assert self.latest_grade() is None
+
+    def test_unstorable_grades_are_none(self):
+        assert _grade_to_decimal('1.755') == Decimal('1.76')
+        assert _grade_to_decimal('999.99') == Decimal('999.99')
+        for grade in ('INC', '', None, 'NaN', 'sNaN', 'Infinity', '-Infinity', '1000', '1e30'):
+            assert _grade_to_decimal(grade) is None, f"{grade!r} should not be stored"
+
+    def test_non_numeric_grade_clears_latest(self):
+        self.post_grade('2.00')
+        self.post_grade('Infinity')
+        assert self.latest_grade() is None
+
+    def test_backfill_uses_most_recent_grade(self):
+        migration = import_module('enrollment.migrations.0011_studentsubject_latest_grade')
+        self.post_grade('2.00')
+        self.post_grade('1.50')
+        StudentSubject.objects.update(latest_grade=None)
+
+        migration.backfill_latest_grade(apps, None)
+        assert self.latest_grade() == Decimal('1.50')
+
+    def test_backfill_skips_unstorable_grades(self):
+        migration = import_module('enrollment.migrations.0011_studentsubject_latest_grade')
+        self.post_grade('NaN')
+        StudentSubject.objects.update(latest_grade=None)
+
+        migration.backfill_latest_grade(apps, None)
+        assert self.latest_grade() is None
@@ -0,0 +1,31 @@
+"""
+Tests for registrar program management.
+"""
+from academics.models import Program
+
+from .utils import RegistrarTestCase
+
+
+class ProgramTests(RegistrarTestCase):
+
+    def test_programs_crud(self):
+        """Test Program CRUD operations."""
+        response = self.client.post('/registrar/academics/programs/create/', {
+            'name': 'Bachelor of Science in Computer Science',
+            'level': 'Bachelor',
+            'passing_grade': '3.00',
+        })
+        assert response.status_code == 200, "Create program"
+
+        program = Program.objects.filter(name='Bachelor of Science in Computer Science').first()
+        assert program is not None, "Program exists in database"
+
+        response = self.client.post(f'/registrar/academics/programs/{program.id}/update/', {
+            'name': 'Bachelor of Science in Computer Science (Updated)',
+            'level': 'Bachelor',
+            'passing_grade': '3.00',
+        })
+        assert response.status_code == 200, "Update program"
+
+        program.refresh_from_db()
+        assert 'Updated' in program.name, "Program name updated"
@@ -0,0 +1,113 @@
+"""
+Simplified tests for registrar features that match the actual implementation.
+"""
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase
+
+from academics.models import Program, Curriculum, Subject
+from academics.views import academics_index
+from enrollment.models import Term, Section
+from enrollment.views import sections_list, terms_list
+from settingsapp.models import Setting
+from settingsapp.views import settings_list
+
+from .utils import (
+    PASSWORD, create_curriculum, create_enrollment_setting, create_program, create_term, create_user,
+    users_by_role,
+)
+
+
+class RegistrarSimpleTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.registrar = create_user('registrar')
+        cls.professor = create_user('professor')
+        cls.student_user = create_user('student')
+        cls.program = create_program()
+        create_curriculum(cls.program)
+        cls.term = create_term(is_active=False)
+        subject = Subject.objects.create(
+            program=cls.program, code='IT101', title='Introduction to Programming', units=3
+        )
+        section = Section.objects.create(term=cls.term, section_code='IT101-A')
+        section.subjects.add(subject)
+        create_enrollment_setting()
+
+    def setUp(self):
+        self.factory = RequestFactory()
+
+    def test_users_seeded(self):
+        users = users_by_role('registrar', 'professor', 'student')
+        assert 'registrar' in users, "Registrar user exists"
+        assert 'professor' in users, "Professor user exists"
+        assert 'student' in users, "Student user exists"
+
+    def test_registrar_access(self):
+        response = self.client.get('/login/')
+        assert response.status_code == 200, "Login page loads"
+
+        assert self.client.login(username=self.registrar.username, password=PASSWORD), "Registrar can login"
+
+        response = self.client.get('/dashboard/registrar/')
+        assert response.status_code == 200, "Registrar dashboard accessible"
+
+    def test_registrar_modules(self):
+        # Only the status is checked, so call the views directly and skip the
+        # middleware stack; the RBAC tests keep using the full client
+        modules = [
+            ('Academics', '/registrar/academics/', academics_index),
+            ('Terms', '/registrar/enrollment/terms/', terms_list),
+            ('Sections', '/registrar/enrollment/sections/', sections_list),
+            ('Settings', '/registrar/settings/', settings_list),
+        ]
+        for name, path, view in modules:
+            request = self.factory.get(path)
+            request.user = self.registrar
+            assert view(request).status_code == 200, f"{name} module accessible"
+
+    def test_view_query_counts(self):
+        """Guard the registrar pages against N+1 regressions; an increase here is a bug."""
+        self.client.force_login(self.registrar)
+        # Start from cold caches so the cached active term and term options are counted
+        cache.clear()
+
+        # session, user
+        with self.assertNumQueries(2):
+            self.client.get('/registrar/academics/')
+
+        # session, user, terms
+        with self.assertNumQueries(3):
+            self.client.get('/registrar/enrollment/terms/')
+
+        # session, user, active term id, sections, subjects and professors
+        # prefetches, term options fragment
+        with self.assertNumQueries(7):
+            self.client.get('/registrar/enrollment/sections/')
+
+    def test_data_models(self):
+        for model in (Program, Curriculum, Subject, Term, Section):
+            assert model.objects.exists(), f"{model.__name__} model exists"
+
+    def test_enrollment_setting(self):
+        enrollment_setting, created = Setting.objects.get_or_create(
+            key_name='enrollment_open',
+            defaults={
+                'value_text': 'false',
+                'description': 'Toggle enrollment',
+                'updated_by': self.registrar
+            }
+        )
+        assert enrollment_setting is not None, "Enrollment setting exists"
+
+    def test_term_activation(self):
+        term = Term.objects.first()
+        term.is_active = True
+        term.save()
+        term.refresh_from_db()
+        assert term.is_active, "Term can be activated"
+
+    def test_student_blocked_from_registrar_module(self):
+        self.client.force_login(self.student_user)
+        response = self.client.get('/registrar/academics/')
+        assert response.status_code == 403, "Student blocked from registrar module"
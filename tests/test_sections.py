@@ -0,0 +1,48 @@
+"""
+Tests for registrar section management.
+"""
+from academics.models import Subject
+from enrollment.models import Section
+
+from .utils import RegistrarTestCase, create_program, create_term, create_user
+
+
+class SectionTests(RegistrarTestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.professor = create_user('professor', first_name='Prof', last_name='Santos')
+        cls.program = create_program()
+        cls.term = create_term()
+
+    def test_section_management(self):
+        """Test Section CRUD operations."""
+        subject1 = Subject.objects.create(
+            program=self.program, code='IT101', title='Introduction to Programming', units=3
+        )
+
+        response = self.client.post('/registrar/enrollment/sections/create/', {
+            'program_id': self.program.id,
+            'subjects[]': [subject1.id],
+            'term_id': self.term.id,
+            'section_code': 'IT101-A',
+            'professors[]': [self.professor.id],
+            'capacity': 30,
+        })
+        assert response.status_code == 302, "Create section"
+
+        section = Section.objects.filter(section_code='IT101-A').first()
+        assert section is not None, "Section exists"
+
+        response = self.client.post(f'/registrar/enrollment/sections/{section.id}/update/', {
+            'section_code': 'IT101-B',
+            'subjects[]': [subject1.id],
+            'professors[]': [self.professor.id],
+            'capacity': 35,
+        })
+        assert response.status_code == 302, "Update section"
+
+        section.refresh_from_db()
+        assert section.section_code == 'IT101-B', "Section code updated"
+        assert section.capacity == 35, "Section capacity updated"
@@ -0,0 +1,67 @@
+"""
+Tests for registrar system settings.
+"""
+import time
+from unittest import mock
+
+from django.core.cache import cache
+
+from settingsapp.cache_utils import ENROLLMENT_OPEN_KEY, SETTING_CACHE_TTL, is_enrollment_open
+from settingsapp.models import Setting
+
+from .utils import RegistrarTestCase, create_enrollment_setting
+
+
+class SettingTests(RegistrarTestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        create_enrollment_setting()
+
+    def test_settings_management(self):
+        """Test Settings list and toggle."""
+        response = self.client.get('/registrar/settings/')
+        assert response.status_code == 200, "Access settings page"
+
+        enrollment_setting = Setting.objects.filter(key_name='enrollment_open').first()
+        assert enrollment_setting is not None, "Enrollment setting exists"
+
+        initial_value = enrollment_setting.value_text
+
+        response = self.client.post('/registrar/settings/toggle/enrollment_open/')
+        assert response.status_code == 302, "Toggle enrollment setting"
+
+        enrollment_setting.refresh_from_db()
+        assert enrollment_setting.value_text != initial_value, "Enrollment setting toggled"
+
+        self.client.post('/registrar/settings/toggle/enrollment_open/')
+        enrollment_setting.refresh_from_db()
+        assert enrollment_setting.value_text == initial_value, "Enrollment setting toggled back"
+
+    def test_toggle_updates_enrollment_open(self):
+        cache.clear()
+        assert not is_enrollment_open(), "Enrollment starts closed"
+
+        # The cache is refreshed on commit
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post('/registrar/settings/toggle/enrollment_open/')
+        assert is_enrollment_open(), "Opening enrollment is visible"
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post('/registrar/settings/toggle/enrollment_open/')
+        assert not is_enrollment_open(), "Closing enrollment is visible"
+
+    def test_process_local_cache_expires_flag(self):
+        cache.clear()
+        assert not is_enrollment_open(), "Flag cached as closed"
+
+        # queryset update() fires no signal, like a toggle made by another worker
+        Setting.objects.filter(key_name=ENROLLMENT_OPEN_KEY).update(value_text='true')
+        assert not is_enrollment_open(), "Stale flag served until it expires"
+
+        # Step the per-process cache's clock past the TTL
+        expired_at = time.time() + SETTING_CACHE_TTL + 1
+        with mock.patch('django.core.cache.backends.locmem.time') as locmem_time:
+            locmem_time.time.return_value = expired_at
+            assert is_enrollment_open(), "Expired flag is re-read from the database"
@@ -0,0 +1,153 @@
+"""
+Tests for the subject availability shown to students at enrollment.
+"""
+from django.core.cache import cache
+from django.test import TestCase
+
+from academics.models import CurriculumSubject, Prereq, Subject
+from enrollment.cache_utils import prereq_map_for_curriculum
+from enrollment.models import Student, StudentSubject
+from enrollment.student_enrollment_views import (
+    get_available_subjects_cached, get_available_subjects_for_student,
+)
+from grades.models import Grade
+
+from .utils import User, PASSWORD, create_curriculum, create_program, create_term, create_user
+
+
+def statuses(subjects_info):
+    return {info['subject'].code: info['status'] for info in subjects_info}
+
+
+class SubjectAvailabilityTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.program = create_program()
+        cls.curriculum = create_curriculum(cls.program)
+        cls.term = create_term()
+        user = User.objects.create_user(username='student', password=PASSWORD, role='student')
+        cls.student = Student.objects.create(
+            user=user, program=cls.program, curriculum=cls.curriculum, status='active'
+        )
+        cls.intro = Subject.objects.create(
+            program=cls.program, code='IT101', title='Introduction to Programming', units=3
+        )
+        CurriculumSubject.objects.create(curriculum=cls.curriculum, subject=cls.intro, year_level=1, term_no=1)
+
+    def setUp(self):
+        # The prerequisite map is cached per process; start each test cold
+        prereq_map_for_curriculum.cache_clear()
+
+    def test_subject_without_prereqs_is_ready(self):
+        subjects_info, _ = get_available_subjects_for_student(self.student, self.term)
+        assert statuses(subjects_info) == {'IT101': 'ready'}
+
+    def test_subject_added_after_map_is_cached_still_checks_prereqs(self):
+        # Warm the prerequisite map before the new subject exists
+        get_available_subjects_for_student(self.student, self.term)
+
+        # bulk_create fires no signals, so the cached map stays stale
+        advanced = Subject.objects.create(
+            program=self.program, code='IT102', title='Data Structures', units=3
+        )
+        Prereq.objects.bulk_create([Prereq(subject=advanced, prereq_subject=self.intro)])
+        CurriculumSubject.objects.bulk_create([
+            CurriculumSubject(curriculum=self.curriculum, subject=advanced, year_level=1, term_no=1)
+        ])
+
+        subjects_info, _ = get_available_subjects_for_student(self.student, self.term)
+        assert statuses(subjects_info)['IT102'] == 'unmet_prerequisite', "Unearned subject offered as ready"
+
+    def test_curriculum_subject_changes_clear_prereq_map(self):
+        assert set(prereq_map_for_curriculum(self.curriculum.id)) == {self.intro.id}
+
+        advanced = Subject.objects.create(
+            program=self.program, code='IT102', title='Data Structures', units=3
+        )
+        link = CurriculumSubject.objects.create(
+            curriculum=self.curriculum, subject=advanced, year_level=1, term_no=2
+        )
+        assert set(prereq_map_for_curriculum(self.curriculum.id)) == {self.intro.id, advanced.id}
+
+        link.delete()
+        assert set(prereq_map_for_curriculum(self.curriculum.id)) == {self.intro.id}
+
+
+class AvailableSubjectsCacheTests(TestCase):
+    """The cached availability list must follow the student's subject and grade changes."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.program = create_program()
+        cls.curriculum = create_curriculum(cls.program)
+        cls.term = create_term()
+        cls.professor = create_user('professor')
+        user = User.objects.create_user(username='student', password=PASSWORD, role='student')
+        cls.student = Student.objects.create(
+            user=user, program=cls.program, curriculum=cls.curriculum, status='active'
+        )
+        cls.intro, cls.advanced = Subject.objects.bulk_create([
+            Subject(program=cls.program, code='IT101', title='Introduction to Programming', units=3),
+            Subject(program=cls.program, code='IT102', title='Data Structures', units=3),
+        ])
+        Prereq.objects.create(subject=cls.advanced, prereq_subject=cls.intro)
+        # IT102 follows IT101 a semester later, so completing IT101 moves the student to its level
+        CurriculumSubject.objects.bulk_create([
+            CurriculumSubject(curriculum=cls.curriculum, subject=cls.intro, year_level=1, term_no=1),
+            CurriculumSubject(curriculum=cls.curriculum, subject=cls.advanced, year_level=1, term_no=2),
+        ])
+
+    def setUp(self):
+        cache.clear()
+        prereq_map_for_curriculum.cache_clear()
+
+    def cached_statuses(self):
+        subjects_info, _ = get_available_subjects_cached(self.student, self.term)
+        return statuses(subjects_info)
+
+    def test_student_subject_change_refreshes_cache(self):
+        assert self.cached_statuses() == {'IT101': 'ready', 'IT102': 'future_level'}
+
+        # The grade version is bumped when the write commits
+        with self.captureOnCommitCallbacks(execute=True):
+            StudentSubject.objects.create(
+                student=self.student, subject=self.intro, term=self.term, status='completed'
+            )
+
+        assert self.cached_statuses() == {'IT101': 'already_taken', 'IT102': 'ready'}
+
+    def test_grade_change_refreshes_cache(self):
+        # Completing another first-semester subject brings the student to IT102's level
+        orientation = Subject.objects.create(program=self.program, code='GE101', title='Orientation', units=1)
+        CurriculumSubject.objects.create(curriculum=self.curriculum, subject=orientation, year_level=1, term_no=1)
+        with self.captureOnCommitCallbacks(execute=True):
+            StudentSubject.objects.create(
+                student=self.student, subject=orientation, term=self.term, status='completed'
+            )
+            student_subject = StudentSubject.objects.create(
+                student=self.student, subject=self.intro, term=self.term, status='inc'
+            )
+        assert self.cached_statuses()['IT102'] == 'unmet_prerequisite'
+
+        # A passing grade on the INC prerequisite changes why IT102 is blocked
+        with self.captureOnCommitCallbacks(execute=True):
+            Grade.objects.create(
+                student_subject=student_subject, subject=self.intro, professor=self.professor, grade='3.00'
+            )
+
+        assert self.cached_statuses()['IT102'] == 'inc_prerequisite'
+
+    def test_bump_waits_for_commit(self):
+        assert self.cached_statuses()['IT101'] == 'ready'
+
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            StudentSubject.objects.create(
+                student=self.student, subject=self.intro, term=self.term, status='completed'
+            )
+            # Not committed yet: the old version, and so the cached list, still applies
+            assert self.cached_statuses()['IT101'] == 'ready'
+
+        for callback in callbacks:
+            callback()
+        assert self.cached_statuses()['IT101'] == 'already_taken'
@@ -0,0 +1,51 @@
+"""
+Tests for registrar subject and prerequisite management.
+"""
+from academics.models import Prereq, Subject
+
+from .utils import RegistrarTestCase, create_program
+
+
+class SubjectTests(RegistrarTestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.program = create_program()
+
+    def test_subjects_crud(self):
+        """Test Subject CRUD operations."""
+        response = self.client.post('/registrar/academics/subjects/create/', {
+            'code': 'IT101',
+            'title': 'Introduction to Programming',
+            'description': 'Basic programming concepts',
+            'units': '3',
+            'type': 'major',
+            'program_id': self.program.id,
+        })
+        assert response.status_code == 200, "Create subject IT101"
+
+        subject1 = Subject.objects.filter(code='IT101').first()
+        assert subject1 is not None, "Subject IT101 exists"
+
+        response = self.client.post('/registrar/academics/subjects/create/', {
+            'code': 'IT102',
+            'title': 'Data Structures',
+            'description': 'Advanced data structures',
+            'units': '3',
+            'type': 'major',
+            'program_id': self.program.id,
+        })
+        assert response.status_code == 200, "Create subject IT102"
+
+        subject2 = Subject.objects.filter(code='IT102').first()
+        assert subject2 is not None, "Subject IT102 exists"
+
+        response = self.client.post('/registrar/academics/prerequisites/add/', {
+            'subject_id': subject2.id,
+            'prereq_subject_id': subject1.id,
+        })
+        assert response.status_code == 200, "Add prerequisite"
+
+        prereq = Prereq.objects.filter(subject=subject2, prereq_subject=subject1).first()
+        assert prereq is not None, "Prerequisite exists"
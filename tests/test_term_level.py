@@ -0,0 +1,49 @@
+"""
+Tests for the Term level feature.
+Each level (SHS, Bachelor, Masteral) has its own independent active term.
+"""
+from django.test import TestCase
+
+from enrollment.models import Term
+
+from .utils import create_term, create_user
+
+TERM_FIELDS = frozenset(f.name for f in Term._meta.get_fields())
+
+
+class TermLevelTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.registrar = create_user('registrar')
+        for level in ('SHS', 'Bachelor', 'Masteral'):
+            for semester in (1, 2):
+                create_term(name=f'{level} Semester {semester}', level=level, is_active=semester == 1)
+
+    def test_term_has_level_field(self):
+        assert 'level' in TERM_FIELDS, "Level field not found in Term model!"
+
+    def test_level_choices(self):
+        assert len(Term.LEVEL_CHOICES) == 3, "Expected 3 level choices"
+
+    def test_existing_terms_have_levels(self):
+        labels = dict(Term.LEVEL_CHOICES)
+        count = 0
+        for t in Term.objects.only('name', 'level', 'is_active').iterator(chunk_size=100):
+            assert labels.get(t.level), f"{t.name} has no level label"
+            count += 1
+        assert count == 6
+
+    def test_terms_list_view(self):
+        self.client.force_login(self.registrar)
+        response = self.client.get('/registrar/enrollment/terms/')
+        assert response.status_code == 200, f"Terms list page returned {response.status_code}"
+
+    def test_level_specific_active_terms(self):
+        rows = Term.objects.filter(
+            is_active=True, level__in=['SHS', 'Bachelor', 'Masteral']
+        ).values('level', 'name')
+        active_terms = {row['level']: row['name'] for row in rows}
+        for level in ('SHS', 'Bachelor', 'Masteral'):
+            assert level in active_terms, f"{level}: No active term"
+            assert active_terms[level] == f'{level} Semester 1'
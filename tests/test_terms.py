@@ -0,0 +1,63 @@
+"""
+Tests for registrar term management.
+"""
+from django.core.cache import cache
+
+from enrollment.models import Term
+from users.cache_utils import get_admin_stats
+
+from .utils import RegistrarTestCase, create_term
+
+
+class TermTests(RegistrarTestCase):
+
+    def test_term_management(self):
+        """Test Term CRUD and activation."""
+        response = self.client.post('/registrar/enrollment/terms/create/', {
+            'name': '1st Semester 2024-2025',
+            'level': 'Bachelor',
+            'start_date': '2024-08-01',
+            'end_date': '2024-12-15',
+            'add_drop_deadline': '2024-08-15',
+            'grade_encoding_deadline': '2024-12-20'
+        })
+        assert response.status_code == 302, "Create term"
+
+        term = Term.objects.filter(name='1st Semester 2024-2025').first()
+        assert term is not None, "Term exists"
+
+        response = self.client.post(f'/registrar/enrollment/terms/{term.id}/activate/')
+        assert response.status_code == 302, "Activate term"
+
+        term.refresh_from_db()
+        assert term.is_active, "Term is active"
+
+        self.client.post('/registrar/enrollment/terms/create/', {
+            'name': '2nd Semester 2024-2025',
+            'level': 'Bachelor',
+            'start_date': '2025-01-01',
+            'end_date': '2025-05-15',
+            'add_drop_deadline': '2025-01-15',
+            'grade_encoding_deadline': '2025-05-20'
+        })
+        term2 = Term.objects.filter(name='2nd Semester 2024-2025').first()
+        assert term2 is not None, "Second term exists"
+
+        response = self.client.post(f'/registrar/enrollment/terms/{term2.id}/activate/')
+        assert response.status_code == 302, "Activate second term"
+
+        # Only one term per level can be active
+        assert Term.objects.filter(is_active=True, level='Bachelor').count() == 1, "Only one active term"
+
+        term.refresh_from_db()
+        assert not term.is_active, "First term deactivated"
+
+    def test_activation_refreshes_dashboard_stats(self):
+        term = create_term(is_active=False)
+        cache.clear()
+        assert get_admin_stats()['active_terms'] == 0
+
+        # The single UPDATE fires no signals; the view drops the counts on commit
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(f'/registrar/enrollment/terms/{term.id}/activate/')
+        assert get_admin_stats()['active_terms'] == 1
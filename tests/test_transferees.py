@@ -0,0 +1,147 @@
+"""
+Tests for transferee enrollment and account creation.
+"""
+from unittest import mock
+
+from django.utils.html import escape
+
+from enrollment.models import TransfereeEnrollment
+from enrollment.transferee_views import (
+    TRANSFEREE_CREDENTIALS_SESSION_KEY, TRANSFEREES_PER_PAGE, email_duplicates,
+)
+
+from .utils import User, RegistrarTestCase, create_curriculum, create_program
+
+
+TRANSFEREE_URL = '/registrar/enrollment/registrar/transferee/'
+
+
+def create_transferee(program, curriculum, **fields):
+    defaults = {
+        'first_name': 'Juan',
+        'last_name': 'Cruz',
+        'email': 'juan.cruz@example.com',
+        'transfer_type': 'external_school',
+        'source_school': 'Other College',
+        'source_program': 'BSCS',
+        'program': program,
+        'curriculum': curriculum,
+        'status': 'tor_verified',
+        'tor_verified': True,
+    }
+    return TransfereeEnrollment.objects.create(**{**defaults, **fields})
+
+
+class TransfereeAccountTests(RegistrarTestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.program = create_program()
+        cls.curriculum = create_curriculum(cls.program)
+        cls.transferee = create_transferee(cls.program, cls.curriculum)
+
+    def create_account(self):
+        return self.client.post(
+            f'{TRANSFEREE_URL}{self.transferee.pk}/', {'action': 'create_account'}
+        )
+
+    def test_username_collision_is_retried(self):
+        User.objects.create_user(username='cruzjuanaaaaaa', password='x', role='student')
+
+        # The first generated suffix collides with the existing user
+        with mock.patch('enrollment.transferee_views.secrets.token_hex', side_effect=['aaaaaa', 'bbbbbb']):
+            response = self.create_account()
+        self.assertRedirects(
+            response, f'{TRANSFEREE_URL}{self.transferee.pk}/credit-subjects/', fetch_redirect_response=False
+        )
+
+        self.transferee.refresh_from_db()
+        assert self.transferee.status == 'account_created'
+        assert self.transferee.created_user.username == 'cruzjuanbbbbbb'
+        assert User.objects.filter(username__startswith='cruzjuan').count() == 2
+
+    def test_credentials_are_kept_in_one_session_key_and_shown_once(self):
+        self.create_account()
+
+        session = self.client.session
+        credentials = session[TRANSFEREE_CREDENTIALS_SESSION_KEY]
+        assert [key for key in session.keys() if 'transferee' in key] == [TRANSFEREE_CREDENTIALS_SESSION_KEY]
+        self.transferee.refresh_from_db()
+        user = self.transferee.created_user
+        assert credentials['username'] == user.username
+        assert credentials['student_id'] == user.student.student_id
+        assert user.check_password(credentials['password'])
+
+        finish_url = f'{TRANSFEREE_URL}{self.transferee.pk}/finish/'
+        self.assertContains(self.client.get(finish_url), escape(credentials['password']))
+        assert TRANSFEREE_CREDENTIALS_SESSION_KEY not in self.client.session
+
+        # A second visit no longer has the password to show
+        self.assertNotContains(self.client.get(finish_url), escape(credentials['password']))
+
+
+class TransfereeCreateTests(RegistrarTestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.program = create_program()
+        cls.curriculum = create_curriculum(cls.program)
+        create_transferee(cls.program, cls.curriculum, email='juan.cruz@example.com')
+        User.objects.create_user(username='maria', email='maria@example.com', password='x', role='student')
+
+    def post_transferee(self, email):
+        return self.client.post(f'{TRANSFEREE_URL}create/', {
+            'first_name': 'Ana',
+            'last_name': 'Reyes',
+            'email': email,
+            'transfer_type': 'external_school',
+            'source_school': 'Other College',
+            'source_program': 'BSCS',
+            'program': self.program.pk,
+            'curriculum': self.curriculum.pk,
+        })
+
+    def test_email_of_existing_user_is_rejected(self):
+        response = self.post_transferee('maria@example.com')
+        self.assertContains(response, 'Email already exists in the system.')
+        self.assertNotContains(response, 'This email is already registered as a transferee.')
+        assert TransfereeEnrollment.objects.count() == 1
+
+    def test_email_of_existing_transferee_is_rejected(self):
+        response = self.post_transferee('juan.cruz@example.com')
+        self.assertContains(response, 'This email is already registered as a transferee.')
+        self.assertNotContains(response, 'Email already exists in the system.')
+        assert TransfereeEnrollment.objects.count() == 1
+
+    def test_email_duplicates_uses_one_query(self):
+        with self.assertNumQueries(1):
+            assert email_duplicates('maria@example.com') == (True, False)
+        with self.assertNumQueries(1):
+            assert email_duplicates('juan.cruz@example.com') == (False, True)
+        with self.assertNumQueries(1):
+            assert email_duplicates('new@example.com') == (False, False)
+
+
+class TransfereeListTests(RegistrarTestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        program = create_program()
+        curriculum = create_curriculum(program)
+        for i in range(TRANSFEREES_PER_PAGE + 1):
+            create_transferee(program, curriculum, email=f'transferee{i}@example.com')
+
+    def test_list_is_paginated(self):
+        response = self.client.get(TRANSFEREE_URL)
+        assert len(response.context['transferees']) == TRANSFEREES_PER_PAGE
+        assert response.context['page_obj'].paginator.count == TRANSFEREES_PER_PAGE + 1
+
+        response = self.client.get(TRANSFEREE_URL, {'page': 2})
+        assert len(response.context['transferees']) == 1
+
+    def test_out_of_range_page_shows_last_page(self):
+        response = self.client.get(TRANSFEREE_URL, {'page': 99})
+        assert response.context['page_obj'].number == 2
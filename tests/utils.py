@@ -0,0 +1,74 @@
+"""
+Seed data helpers shared by the test classes' setUpTestData.
+"""
+import datetime
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from academics.models import Curriculum, Program
+from enrollment.models import Student, Term
+from settingsapp.models import Setting
+
+User = get_user_model()
+
+PASSWORD = 'password123'
+
+
+def create_user(role, **fields):
+    """Create a user whose username is its role."""
+    user = User.objects.create_user(username=role, password=PASSWORD, role=role, **fields)
+    if role == 'student':
+        Student.objects.create(user=user)
+    return user
+
+
+def users_by_role(*roles):
+    """
+    Get the first user of each role in one query, as {role: user}.
+    in_bulk(field_name='role') is not usable because role is not unique.
+    """
+    users = {}
+    for user in User.objects.filter(role__in=roles).order_by('-pk'):
+        users[user.role] = user
+    return users
+
+
+def create_program(name='Bachelor of Science in Information Technology', level='Bachelor'):
+    return Program.objects.create(name=name, level=level)
+
+
+def create_curriculum(program, version='2024'):
+    return Curriculum.objects.create(program=program, version=version, effective_sy='2024-2025', active=True)
+
+
+def create_term(name='1st Semester 2023-2024', level='Bachelor', is_active=True):
+    return Term.objects.create(
+        name=name,
+        level=level,
+        start_date=datetime.date(2023, 8, 1),
+        end_date=datetime.date(2023, 12, 15),
+        is_active=is_active,
+    )
+
+
+def create_enrollment_setting():
+    setting, _ = Setting.objects.get_or_create(
+        key_name='enrollment_open',
+        defaults={'value_text': 'false', 'description': 'Toggle to enable or disable student enrollment'},
+    )
+    return setting
+
+
+class RegistrarTestCase(TestCase):
+    """
+    Base class for registrar module tests.
+    Seeds a registrar once per class and logs the test client in as them.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.registrar = create_user('registrar')
+
+    def setUp(self):
+        self.client.force_login(self.registrar)
@@ -1,11 +1,20 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from .models import User
 
 
+class UserChangeList(ChangeList):
+    """Changelist that only loads the columns shown in list_display."""
+
+    def get_queryset(self, request, exclude_parameters=None):
+        return super().get_queryset(request, exclude_parameters).only(*self.model_admin.list_display)
+
+
 @admin.register(User)
 class UserAdmin(BaseUserAdmin):
     list_display = ('username', 'email', 'role', 'first_name', 'last_name', 'is_staff', 'is_active')
+    list_select_related = ()
     list_filter = ('role', 'is_staff', 'is_active', 'is_superuser')
     search_fields = ('username', 'email', 'first_name', 'last_name')
     ordering = ('-date_joined',)
@@ -17,3 +26,8 @@ class UserAdmin(BaseUserAdmin):
     add_fieldsets = BaseUserAdmin.add_fieldsets + (
         ('Role Information', {'fields': ('role',)}),
     )
+
+    def get_changelist(self, request, **kwargs):
+        # Restrict columns on the changelist only; get_queryset() also backs
+        # the change form, which needs every field
+        return UserChangeList
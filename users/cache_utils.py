@@ -0,0 +1,81 @@
+"""
+Cache helpers for dashboard statistics.
+Uses Django's cache framework (configured via settings.CACHES).
+"""
+
+from django.core.cache import cache
+from django.db.models import Count, Q
+
+from academics.models import Program, Subject
+from enrollment.models import Section, Student, Term, TransfereeEnrollment
+from .models import User
+
+
+ADMIN_STATS_CACHE_KEY = 'dashboard_stats:admin'
+DEAN_STATS_CACHE_KEY = 'dashboard_stats:dean'
+ADMISSION_STATS_CACHE_KEY = 'dashboard_stats:admission'
+
+# Signals drop the counts on every change; the TTL only bounds how stale they
+# get after bulk_create/update(), which skip signals
+DASHBOARD_STATS_CACHE_TTL = 60
+
+
+def _student_stats():
+    return Student.objects.aggregate(
+        total_students=Count('id'),
+        active_students=Count('id', filter=Q(status='active')),
+    )
+
+
+def _admin_stats():
+    # One aggregate per model; both User counts share a single query
+    user_stats = User.objects.aggregate(
+        total=Count('id'),
+        professors=Count('id', filter=Q(role='professor')),
+    )
+    term_stats = Term.objects.aggregate(active=Count('id', filter=Q(is_active=True)))
+    return {
+        'total_students': Student.objects.count(),
+        'total_programs': Program.objects.count(),
+        'total_subjects': Subject.objects.count(),
+        'active_terms': term_stats['active'],
+        'total_sections': Section.objects.count(),
+        'total_users': user_stats['total'],
+        'total_professors': user_stats['professors'],
+    }
+
+
+def _dean_stats():
+    return {
+        **_student_stats(),
+        'total_sections': Section.objects.count(),
+    }
+
+
+def _admission_stats():
+    return {
+        **_student_stats(),
+        'pending_transferees': TransfereeEnrollment.objects.exclude(
+            status__in=['rejected', 'account_created']
+        ).count(),
+    }
+
+
+def get_admin_stats():
+    """Get the admin dashboard counts, cached for DASHBOARD_STATS_CACHE_TTL seconds."""
+    return cache.get_or_set(ADMIN_STATS_CACHE_KEY, _admin_stats, DASHBOARD_STATS_CACHE_TTL)
+
+
+def get_dean_stats():
+    """Get the dean dashboard counts, cached for DASHBOARD_STATS_CACHE_TTL seconds."""
+    return cache.get_or_set(DEAN_STATS_CACHE_KEY, _dean_stats, DASHBOARD_STATS_CACHE_TTL)
+
+
+def get_admission_stats():
+    """Get the admission dashboard counts, cached for DASHBOARD_STATS_CACHE_TTL seconds."""
+    return cache.get_or_set(ADMISSION_STATS_CACHE_KEY, _admission_stats, DASHBOARD_STATS_CACHE_TTL)
+
+
+def invalidate_dashboard_stats():
+    """Drop every cached dashboard count."""
+    cache.delete_many([ADMIN_STATS_CACHE_KEY, DEAN_STATS_CACHE_KEY, ADMISSION_STATS_CACHE_KEY])
@@ -13,6 +13,9 @@ def role_required(*allowed_roles):
         def my_view(request):
             ...
     """
+    # Built once per decorated view instead of scanning the tuple per request
+    allowed = frozenset(allowed_roles)
+
     def decorator(view_func):
         @wraps(view_func)
         def wrapper(request, *args, **kwargs):
@@ -22,7 +25,7 @@ def role_required(*allowed_roles):
                 return redirect('login')
 
             # Check if user has the required role
-            if request.user.role not in allowed_roles:
+            if request.user.role not in allowed:
                 messages.error(request, f'Access denied. This page is only accessible to: {", ".join(allowed_roles)}')
                 raise PermissionDenied
 
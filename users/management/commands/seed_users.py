@@ -1,9 +1,52 @@
+from collections import namedtuple
+
 from django.core.management.base import BaseCommand
 from django.contrib.auth.hashers import make_password
+from django.db import transaction
 from users.models import User
 from enrollment.models import Student
 from academics.models import Program, Curriculum
 
+Seed = namedtuple('Seed', 'username email first_name last_name role is_staff')
+
+# Users to create
+SEEDS = (
+    # Admins
+    Seed('admin1', 'admin1@richwell.edu', 'John', 'Administrator', 'admin', True),
+    Seed('admin2', 'admin2@richwell.edu', 'Jane', 'Admin', 'admin', True),
+
+    # Registrars
+    Seed('registrar1', 'registrar1@richwell.edu', 'Maria', 'Santos', 'registrar', True),
+    Seed('registrar2', 'registrar2@richwell.edu', 'Robert', 'Cruz', 'registrar', True),
+
+    # Professors
+    Seed('prof1', 'prof1@richwell.edu', 'Dr. Michael', 'Garcia', 'professor', False),
+    Seed('prof2', 'prof2@richwell.edu', 'Dr. Sarah', 'Reyes', 'professor', False),
+    Seed('prof3', 'prof3@richwell.edu', 'Dr. David', 'Gonzales', 'professor', False),
+    Seed('prof4', 'prof4@richwell.edu', 'Dr. Lisa', 'Mendoza', 'professor', False),
+    Seed('prof5', 'prof5@richwell.edu', 'Dr. James', 'Torres', 'professor', False),
+
+    # Deans
+    Seed('dean1', 'dean1@richwell.edu', 'Dr. Elizabeth', 'Ramos', 'dean', True),
+    Seed('dean2', 'dean2@richwell.edu', 'Dr. William', 'Flores', 'dean', True),
+
+    # Admission Officers
+    Seed('admission1', 'admission1@richwell.edu', 'Anna', 'Bautista', 'admission', True),
+    Seed('admission2', 'admission2@richwell.edu', 'Mark', 'Villanueva', 'admission', True),
+
+    # Students
+    Seed('student1', 'student1@richwell.edu', 'Juan', 'Dela Cruz', 'student', False),
+    Seed('student2', 'student2@richwell.edu', 'Maria', 'Rodriguez', 'student', False),
+    Seed('student3', 'student3@richwell.edu', 'Pedro', 'Martinez', 'student', False),
+    Seed('student4', 'student4@richwell.edu', 'Ana', 'Lopez', 'student', False),
+    Seed('student5', 'student5@richwell.edu', 'Carlos', 'Hernandez', 'student', False),
+    Seed('student6', 'student6@richwell.edu', 'Sofia', 'Gonzalez', 'student', False),
+    Seed('student7', 'student7@richwell.edu', 'Miguel', 'Perez', 'student', False),
+    Seed('student8', 'student8@richwell.edu', 'Isabella', 'Sanchez', 'student', False),
+    Seed('student9', 'student9@richwell.edu', 'Diego', 'Ramirez', 'student', False),
+    Seed('student10', 'student10@richwell.edu', 'Lucia', 'Torres', 'student', False),
+)
+
 
 class Command(BaseCommand):
     help = 'Seed the database with test users for all roles'
@@ -21,6 +64,8 @@ class Command(BaseCommand):
             help='Default password for all seeded users (default: password123)',
         )
 
+    # Commit the clear, the users and the student profiles together
+    @transaction.atomic
     def handle(self, *args, **options):
         clear = options['clear']
         default_password = options['password']
@@ -32,217 +77,43 @@ class Command(BaseCommand):
             deleted_count = User.objects.filter(is_superuser=False).delete()[0]
             self.stdout.write(self.style.WARNING(f'Cleared {deleted_count} existing users'))
 
-        # Users to create
-        users_data = [
-            # Admins
-            {
-                'username': 'admin1',
-                'email': 'admin1@richwell.edu',
-                'first_name': 'John',
-                'last_name': 'Administrator',
-                'role': 'admin',
-                'is_staff': True,
-            },
-            {
-                'username': 'admin2',
-                'email': 'admin2@richwell.edu',
-                'first_name': 'Jane',
-                'last_name': 'Admin',
-                'role': 'admin',
-                'is_staff': True,
-            },
-
-            # Registrars
-            {
-                'username': 'registrar1',
-                'email': 'registrar1@richwell.edu',
-                'first_name': 'Maria',
-                'last_name': 'Santos',
-                'role': 'registrar',
-                'is_staff': True,
-            },
-            {
-                'username': 'registrar2',
-                'email': 'registrar2@richwell.edu',
-                'first_name': 'Robert',
-                'last_name': 'Cruz',
-                'role': 'registrar',
-                'is_staff': True,
-            },
-
-            # Professors
-            {
-                'username': 'prof1',
-                'email': 'prof1@richwell.edu',
-                'first_name': 'Dr. Michael',
-                'last_name': 'Garcia',
-                'role': 'professor',
-            },
-            {
-                'username': 'prof2',
-                'email': 'prof2@richwell.edu',
-                'first_name': 'Dr. Sarah',
-                'last_name': 'Reyes',
-                'role': 'professor',
-            },
-            {
-                'username': 'prof3',
-                'email': 'prof3@richwell.edu',
-                'first_name': 'Dr. David',
-                'last_name': 'Gonzales',
-                'role': 'professor',
-            },
-            {
-                'username': 'prof4',
-                'email': 'prof4@richwell.edu',
-                'first_name': 'Dr. Lisa',
-                'last_name': 'Mendoza',
-                'role': 'professor',
-            },
-            {
-                'username': 'prof5',
-                'email': 'prof5@richwell.edu',
-                'first_name': 'Dr. James',
-                'last_name': 'Torres',
-                'role': 'professor',
-            },
-
-            # Deans
-            {
-                'username': 'dean1',
-                'email': 'dean1@richwell.edu',
-                'first_name': 'Dr. Elizabeth',
-                'last_name': 'Ramos',
-                'role': 'dean',
-                'is_staff': True,
-            },
-            {
-                'username': 'dean2',
-                'email': 'dean2@richwell.edu',
-                'first_name': 'Dr. William',
-                'last_name': 'Flores',
-                'role': 'dean',
-                'is_staff': True,
-            },
-
-            # Admission Officers
-            {
-                'username': 'admission1',
-                'email': 'admission1@richwell.edu',
-                'first_name': 'Anna',
-                'last_name': 'Bautista',
-                'role': 'admission',
-                'is_staff': True,
-            },
-            {
-                'username': 'admission2',
-                'email': 'admission2@richwell.edu',
-                'first_name': 'Mark',
-                'last_name': 'Villanueva',
-                'role': 'admission',
-                'is_staff': True,
-            },
-
-            # Students
-            {
-                'username': 'student1',
-                'email': 'student1@richwell.edu',
-                'first_name': 'Juan',
-                'last_name': 'Dela Cruz',
-                'role': 'student',
-            },
-            {
-                'username': 'student2',
-                'email': 'student2@richwell.edu',
-                'first_name': 'Maria',
-                'last_name': 'Rodriguez',
-                'role': 'student',
-            },
-            {
-                'username': 'student3',
-                'email': 'student3@richwell.edu',
-                'first_name': 'Pedro',
-                'last_name': 'Martinez',
-                'role': 'student',
-            },
-            {
-                'username': 'student4',
-                'email': 'student4@richwell.edu',
-                'first_name': 'Ana',
-                'last_name': 'Lopez',
-                'role': 'student',
-            },
-            {
-                'username': 'student5',
-                'email': 'student5@richwell.edu',
-                'first_name': 'Carlos',
-                'last_name': 'Hernandez',
-                'role': 'student',
-            },
-            {
-                'username': 'student6',
-                'email': 'student6@richwell.edu',
-                'first_name': 'Sofia',
-                'last_name': 'Gonzalez',
-                'role': 'student',
-            },
-            {
-                'username': 'student7',
-                'email': 'student7@richwell.edu',
-                'first_name': 'Miguel',
-                'last_name': 'Perez',
-                'role': 'student',
-            },
-            {
-                'username': 'student8',
-                'email': 'student8@richwell.edu',
-                'first_name': 'Isabella',
-                'last_name': 'Sanchez',
-                'role': 'student',
-            },
-            {
-                'username': 'student9',
-                'email': 'student9@richwell.edu',
-                'first_name': 'Diego',
-                'last_name': 'Ramirez',
-                'role': 'student',
-            },
-            {
-                'username': 'student10',
-                'email': 'student10@richwell.edu',
-                'first_name': 'Lucia',
-                'last_name': 'Torres',
-                'role': 'student',
-            },
-        ]
-
         created_users = []
         skipped_users = []
 
-        for user_data in users_data:
-            username = user_data['username']
+        # Look up the usernames that already exist in one query
+        existing = set(
+            User.objects.filter(
+                username__in=[seed.username for seed in SEEDS]
+            ).values_list('username', flat=True)
+        )
+
+        # Every seeded user shares the password, so hash it only once
+        hashed_password = make_password(default_password)
 
-            # Check if user already exists
-            if User.objects.filter(username=username).exists():
-                skipped_users.append(username)
+        new_users = []
+        for seed in SEEDS:
+            if seed.username in existing:
+                skipped_users.append(seed.username)
                 continue
 
-            # Create user
-            user = User.objects.create(
-                username=user_data['username'],
-                email=user_data['email'],
-                first_name=user_data['first_name'],
-                last_name=user_data['last_name'],
-                role=user_data['role'],
-                is_staff=user_data.get('is_staff', False),
-                password=make_password(default_password),
-            )
-            created_users.append(f"{username} ({user_data['role']})")
+            new_users.append(User(
+                username=seed.username,
+                email=seed.email,
+                first_name=seed.first_name,
+                last_name=seed.last_name,
+                role=seed.role,
+                is_staff=seed.is_staff,
+                password=hashed_password,
+            ))
+            created_users.append(f'{seed.username} ({seed.role})')
+
+        # Create all new users in a single INSERT
+        User.objects.bulk_create(new_users, batch_size=500, ignore_conflicts=True)
 
         # Create Student profiles for student users
-        student_users = User.objects.filter(role='student', student__isnull=True)
+        student_users = list(User.objects.filter(role='student', student__isnull=True))
 
-        if student_users.exists():
+        if student_users:
             # Get or create a default program and curriculum
             program, _ = Program.objects.get_or_create(
                 name='Bachelor of Science in Computer Science',
@@ -261,47 +132,50 @@ class Command(BaseCommand):
                 }
             )
 
-            students_created = 0
-            for user in student_users:
-                Student.objects.create(
+            students_created = len(Student.objects.bulk_create([
+                Student(
                     user=user,
                     program=program,
                     curriculum=curriculum,
                     status='active',
                 )
-                students_created += 1
+                for user in student_users
+            ], batch_size=500))
 
             self.stdout.write(
                 self.style.SUCCESS(f'Created {students_created} Student profiles')
             )
 
-        # Summary
-        self.stdout.write('')
-        self.stdout.write(self.style.SUCCESS('=' * 60))
-        self.stdout.write(self.style.SUCCESS('USER SEEDING COMPLETE'))
-        self.stdout.write(self.style.SUCCESS('=' * 60))
-        self.stdout.write('')
+        # Summary, built up and written in one call
+        lines = [
+            '',
+            self.style.SUCCESS('=' * 60),
+            self.style.SUCCESS('USER SEEDING COMPLETE'),
+            self.style.SUCCESS('=' * 60),
+            '',
+        ]
 
         if created_users:
-            self.stdout.write(self.style.SUCCESS(f'Created {len(created_users)} users:'))
-            for user in created_users:
-                self.stdout.write(f'  - {user}')
+            lines.append(self.style.SUCCESS(f'Created {len(created_users)} users:'))
+            lines.extend(f'  - {user}' for user in created_users)
 
         if skipped_users:
-            self.stdout.write('')
-            self.stdout.write(self.style.WARNING(f'Skipped {len(skipped_users)} existing users:'))
-            for user in skipped_users:
-                self.stdout.write(f'  - {user}')
-
-        self.stdout.write('')
-        self.stdout.write(self.style.SUCCESS('Default password for all users: ') + self.style.WARNING(default_password))
-        self.stdout.write('')
-        self.stdout.write('User credentials summary:')
-        self.stdout.write('  Admins: admin1, admin2')
-        self.stdout.write('  Registrars: registrar1, registrar2')
-        self.stdout.write('  Professors: prof1, prof2, prof3, prof4, prof5')
-        self.stdout.write('  Deans: dean1, dean2')
-        self.stdout.write('  Admission: admission1, admission2')
-        self.stdout.write('  Students: student1-student10')
-        self.stdout.write('')
-        self.stdout.write(self.style.SUCCESS('You can now login with any username and the default password'))
+            lines.append('')
+            lines.append(self.style.WARNING(f'Skipped {len(skipped_users)} existing users:'))
+            lines.extend(f'  - {user}' for user in skipped_users)
+
+        lines.extend([
+            '',
+            self.style.SUCCESS('Default password for all users: ') + self.style.WARNING(default_password),
+            '',
+            'User credentials summary:',
+            '  Admins: admin1, admin2',
+            '  Registrars: registrar1, registrar2',
+            '  Professors: prof1, prof2, prof3, prof4, prof5',
+            '  Deans: dean1, dean2',
+            '  Admission: admission1, admission2',
+            '  Students: student1-student10',
+            '',
+            self.style.SUCCESS('You can now login with any username and the default password'),
+        ])
+        self.stdout.write('\n'.join(lines))
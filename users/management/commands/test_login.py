@@ -1,7 +1,12 @@
+from collections import defaultdict
+
 from django.core.management.base import BaseCommand
 from django.contrib.auth import authenticate
 from users.models import User
 
+# Roles reported by test_all_users, in display order
+ROLES = ('admin', 'registrar', 'professor', 'dean', 'admission', 'student')
+
 
 class Command(BaseCommand):
     help = 'Test login credentials for seeded users'
@@ -59,49 +64,69 @@ class Command(BaseCommand):
 
     def test_all_users(self, password):
         """Test login for all users by role"""
-        self.stdout.write(self.style.SUCCESS('\n' + '=' * 60))
-        self.stdout.write(self.style.SUCCESS('TESTING ALL SEEDED USERS'))
-        self.stdout.write(self.style.SUCCESS('=' * 60))
-
-        roles = ['admin', 'registrar', 'professor', 'dean', 'admission', 'student']
+        # Collect the report and write it in one call
+        lines = [
+            self.style.SUCCESS('\n' + '=' * 60),
+            self.style.SUCCESS('TESTING ALL SEEDED USERS'),
+            self.style.SUCCESS('=' * 60),
+        ]
+
+        # Load every seeded user in one query and group them by role
+        users_by_role = defaultdict(list)
+        for user in User.objects.filter(role__in=ROLES).only(
+            'username', 'password', 'role', 'first_name', 'last_name', 'email', 'is_active'
+        ).order_by('role', 'username'):
+            users_by_role[user.role].append(user)
+
+        # Seeded users share a password hash, so each distinct hash is only
+        # run through the (deliberately slow) hasher once
+        verified = {}
 
         successful = 0
         failed = 0
 
-        for role in roles:
-            users = User.objects.filter(role=role).order_by('username')
+        for role in ROLES:
+            users = users_by_role[role]
 
-            if users.exists():
-                self.stdout.write(f'\n{role.upper()}S ({users.count()})'.center(60, '-'))
+            if users:
+                lines.append(f'\n{role.upper()}S ({len(users)})'.center(60, '-'))
 
                 for user in users:
-                    auth_user = authenticate(username=user.username, password=password)
+                    if user.password not in verified:
+                        verified[user.password] = user.check_password(password)
 
-                    if auth_user:
+                    # Same outcome as authenticate(): inactive users cannot log in
+                    if user.is_active and verified[user.password]:
                         status = self.style.SUCCESS('OK')
                         successful += 1
                     else:
                         status = self.style.ERROR('FAIL')
                         failed += 1
 
-                    self.stdout.write(
+                    lines.append(
                         f'  [{status}] {user.username:15} | {user.get_full_name():30} | {user.email}'
                     )
 
         # Summary
-        self.stdout.write('\n' + '=' * 60)
-        self.stdout.write(self.style.SUCCESS(f'SUMMARY: {successful} successful, {failed} failed'))
-        self.stdout.write('=' * 60)
+        lines.extend([
+            '\n' + '=' * 60,
+            self.style.SUCCESS(f'SUMMARY: {successful} successful, {failed} failed'),
+            '=' * 60,
+        ])
 
         if successful > 0:
-            self.stdout.write('\n' + self.style.SUCCESS('All users can login with:'))
-            self.stdout.write(self.style.WARNING(f'  Password: {password}'))
-            self.stdout.write(self.style.SUCCESS(f'  Login URL: http://127.0.0.1:8000/login/'))
-            self.stdout.write('')
-            self.stdout.write('Example logins:')
-            self.stdout.write('  admin1 / password123 -> Admin Dashboard')
-            self.stdout.write('  registrar1 / password123 -> Registrar Dashboard')
-            self.stdout.write('  prof1 / password123 -> Professor Dashboard')
-            self.stdout.write('  student1 / password123 -> Student Dashboard')
-            self.stdout.write('  dean1 / password123 -> Dean Dashboard')
-            self.stdout.write('  admission1 / password123 -> Admission Dashboard')
+            lines.extend([
+                '\n' + self.style.SUCCESS('All users can login with:'),
+                self.style.WARNING(f'  Password: {password}'),
+                self.style.SUCCESS(f'  Login URL: http://127.0.0.1:8000/login/'),
+                '',
+                'Example logins:',
+                '  admin1 / password123 -> Admin Dashboard',
+                '  registrar1 / password123 -> Registrar Dashboard',
+                '  prof1 / password123 -> Professor Dashboard',
+                '  student1 / password123 -> Student Dashboard',
+                '  dean1 / password123 -> Dean Dashboard',
+                '  admission1 / password123 -> Admission Dashboard',
+            ])
+
+        self.stdout.write('\n'.join(lines))
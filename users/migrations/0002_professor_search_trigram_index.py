@@ -0,0 +1,31 @@
+from django.db import migrations
+
+
+def create_trigram_index(apps, schema_editor):
+    # Trigram indexes are PostgreSQL-only; other backends keep plain LIKE scans
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS user_prof_trgm '
+        'ON users_user USING gin '
+        '(first_name gin_trgm_ops, last_name gin_trgm_ops, username gin_trgm_ops) '
+        "WHERE role = 'professor'"
+    )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS user_prof_trgm')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
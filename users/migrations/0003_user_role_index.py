@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2025-11-20 11:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_professor_search_trigram_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='role',
+            field=models.CharField(choices=[('student', 'Student'), ('professor', 'Professor'), ('registrar', 'Registrar'), ('dean', 'Dean'), ('admission', 'Admission'), ('admin', 'Admin')], db_index=True, max_length=20),
+        ),
+    ]
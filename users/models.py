@@ -11,7 +11,7 @@ class User(AbstractUser):
         ('admission', 'Admission'),
         ('admin', 'Admin'),
     ]
-    role = models.CharField(max_length=20, choices=ROLE_CHOICES)
+    role = models.CharField(max_length=20, choices=ROLE_CHOICES, db_index=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self):
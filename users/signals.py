@@ -0,0 +1,38 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from academics.models import Program, Subject
+from enrollment.models import Section, Student, Term, TransfereeEnrollment
+from .cache_utils import invalidate_dashboard_stats
+from .models import User
+
+
+@receiver(post_save, sender=Student)
+@receiver(post_delete, sender=Student)
+@receiver(post_save, sender=Program)
+@receiver(post_delete, sender=Program)
+@receiver(post_save, sender=Subject)
+@receiver(post_delete, sender=Subject)
+@receiver(post_save, sender=Term)
+@receiver(post_delete, sender=Term)
+@receiver(post_save, sender=Section)
+@receiver(post_delete, sender=Section)
+@receiver(post_save, sender=TransfereeEnrollment)
+@receiver(post_delete, sender=TransfereeEnrollment)
+def invalidate_dashboard_stats_cache(sender, instance, **kwargs):
+    """Drop the cached dashboard counts when a counted model changes."""
+    invalidate_dashboard_stats()
+
+
+@receiver(post_save, sender=User)
+def invalidate_dashboard_stats_on_user_save(sender, instance, created, update_fields, **kwargs):
+    """Drop the cached dashboard counts when a user is added or their role may have changed."""
+    # Logins save last_login with update_fields, which leaves the counts as they are
+    if created or update_fields is None or 'role' in update_fields:
+        invalidate_dashboard_stats()
+
+
+@receiver(post_delete, sender=User)
+def invalidate_dashboard_stats_on_user_delete(sender, instance, **kwargs):
+    """Drop the cached dashboard counts when a user is deleted."""
+    invalidate_dashboard_stats()
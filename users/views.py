@@ -1,9 +1,87 @@
+import hashlib
+from functools import lru_cache
+
+from django.http import HttpResponseRedirect
+from django.conf import settings
 from django.shortcuts import render, redirect
-from django.contrib.auth import authenticate, login as auth_login, logout as auth_logout
+from django.contrib.auth import login as auth_login, logout as auth_logout, update_session_auth_hash
 from django.contrib.auth.forms import AuthenticationForm
+from django.contrib.auth.password_validation import validate_password
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Prefetch, Sum, Value
+from django.db.models.functions import Concat, Trim
+from django.urls import reverse
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
+from academics.models import Curriculum, Program, Subject
+from audit.utils import record_audit
+from enrollment.cache_utils import get_active_term_id, get_all_programs
+from enrollment.models import Section, Student, StudentSubject, Term, TransfereeEnrollment
+from enrollment.student_enrollment_views import can_student_enroll
+from .cache_utils import get_admin_stats, get_admission_stats, get_dean_stats
 from .decorators import role_required
+from .models import User
+
+# URL name of each role's dashboard
+ROLE_DASHBOARDS = {
+    'admin': 'admin_dashboard',
+    'registrar': 'registrar_dashboard',
+    'professor': 'professor_dashboard',
+    'student': 'student_dashboard',
+    'admission': 'admission_dashboard',
+    'dean': 'dean_dashboard',
+}
+
+
+def _dashboard_etag(*sources):
+    """
+    Build an etag_func for a dashboard rendered from cached data.
+    The tag covers the release (DASHBOARD_ETAG_VERSION), the viewing user and
+    the output of each source callable, so an unchanged page is answered with
+    304 without rendering the template.
+    """
+    def etag_func(request):
+        # Pending flash messages are part of the page; send those in full
+        if len(messages.get_messages(request)):
+            return None
+        user = request.user
+        data = (
+            settings.DASHBOARD_ETAG_VERSION,
+            user.pk, user.username, user.get_full_name(), user.role,
+            *(source() for source in sources),
+        )
+        return hashlib.md5(repr(data).encode(), usedforsecurity=False).hexdigest()
+    return etag_func
+
+
+def _program_rows():
+    return [(p.pk, p.name, p.level, p.passing_grade) for p in get_all_programs()]
+
+
+# Student dashboard context for a user without a Student profile
+_EMPTY_STUDENT_CONTEXT = {
+    'student': None,
+    'enrolled_subjects': (),
+    'total_units': 0,
+    'has_active_enrollment': False,
+    'can_enroll': False,
+    'enrollment_message': None,
+    'enrollment_details': {},
+    'active_term': None,
+}
+
+
+@lru_cache(maxsize=None)
+def dashboard_url(role):
+    """
+    Get the dashboard URL for a role (None for an unknown role).
+    Reversed on first use and kept for the life of the process.
+    """
+    name = ROLE_DASHBOARDS.get(role)
+    return reverse(name) if name else None
 
 
 def login_view(request):
@@ -16,18 +94,15 @@ def login_view(request):
     if request.method == 'POST':
         form = AuthenticationForm(request, data=request.POST)
         if form.is_valid():
-            username = form.cleaned_data.get('username')
-            password = form.cleaned_data.get('password')
-            user = authenticate(username=username, password=password)
-
-            if user is not None:
-                auth_login(request, user)
-                messages.success(request, f'Welcome back, {user.get_full_name() or user.username}!')
-                return redirect('dashboard')
-            else:
-                messages.error(request, 'Invalid username or password.')
-        else:
-            messages.error(request, 'Invalid username or password.')
+            # The form already authenticated the credentials in clean()
+            user = form.get_user()
+            auth_login(request, user)
+            messages.success(request, f'Welcome back, {user.get_full_name() or user.username}!')
+            # Go straight to the role dashboard instead of bouncing through dashboard_view
+            target = dashboard_url(user.role)
+            return HttpResponseRedirect(target) if target else redirect('dashboard')
+        # Unknown user, wrong password or inactive account alike
+        messages.error(request, 'Invalid username or password.')
     else:
         form = AuthenticationForm()
 
@@ -48,47 +123,22 @@ def dashboard_view(request):
     """
     Main dashboard view that redirects to role-specific dashboards.
     """
-    user = request.user
-    role = user.role
-
-    # Redirect to role-specific dashboard
-    if role == 'admin':
-        return redirect('admin_dashboard')
-    elif role == 'registrar':
-        return redirect('registrar_dashboard')
-    elif role == 'professor':
-        return redirect('professor_dashboard')
-    elif role == 'student':
-        return redirect('student_dashboard')
-    elif role == 'admission':
-        return redirect('admission_dashboard')
-    elif role == 'dean':
-        return redirect('dean_dashboard')
-    else:
+    target = dashboard_url(request.user.role)
+    if not target:
         messages.error(request, 'Invalid user role.')
         return redirect('login')
+    return HttpResponseRedirect(target)
 
 
 # Role-specific Dashboard Views
 @role_required('admin')
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=_dashboard_etag(get_admin_stats))
 def admin_dashboard(request):
     """
     Admin dashboard with system overview and links to all modules.
     """
-    from enrollment.models import Student, Term, Section
-    from academics.models import Program, Subject
-    from grades.models import Grade
-    from users.models import User
-
-    context = {
-        'total_students': Student.objects.count(),
-        'total_programs': Program.objects.count(),
-        'total_subjects': Subject.objects.count(),
-        'active_terms': Term.objects.filter(is_active=True).count(),
-        'total_sections': Section.objects.count(),
-        'total_users': User.objects.count(),
-        'total_professors': User.objects.filter(role='professor').count(),
-    }
+    context = get_admin_stats()
     return render(request, 'dashboards/admin_dashboard.html', context)
 
 
@@ -97,25 +147,30 @@ def registrar_dashboard(request):
     """
     Registrar dashboard with terms, sections, curriculum control, and transferee management.
     """
-    from enrollment.models import Term, Section, TransfereeEnrollment
-    from academics.models import Program, Curriculum
-
-    # Transferee statistics
-    pending_transferees = TransfereeEnrollment.objects.filter(
-        status='pending_tor_verification'
-    ).count()
-
-    tor_verified_transferees = TransfereeEnrollment.objects.filter(
-        status='tor_verified'
-    ).count()
+    # Term joined and the subject/professor M2Ms prefetched with only the
+    # columns the table renders
+    recent_sections = list(
+        Section.objects.select_related('term')
+        .only('section_code', 'capacity', 'status', 'created_at', 'term__name')
+        .prefetch_related(
+            Prefetch('subjects', queryset=Subject.objects.only('code')),
+            Prefetch('professors', queryset=User.objects.only('first_name', 'last_name')),
+        )
+        .order_by('-created_at')[:10]
+    )
+
+    # Transferee statistics: one grouped count over the status index
+    by_status = dict(
+        TransfereeEnrollment.objects.order_by().values_list('status').annotate(Count('id'))
+    )
 
     context = {
-        'active_terms': Term.objects.filter(is_active=True, archived=False),
-        'recent_sections': Section.objects.all().order_by('-created_at')[:10],
+        'active_terms': list(Term.objects.filter(is_active=True, archived=False)),
+        'recent_sections': recent_sections,
         'total_programs': Program.objects.count(),
         'total_curricula': Curriculum.objects.filter(active=True).count(),
-        'pending_transferees': pending_transferees,
-        'tor_verified_transferees': tor_verified_transferees,
+        'pending_transferees': by_status.get('pending_tor_verification', 0),
+        'tor_verified_transferees': by_status.get('tor_verified', 0),
     }
     return render(request, 'dashboards/registrar_dashboard.html', context)
 
@@ -125,13 +180,16 @@ def professor_dashboard(request):
     """
     Professor dashboard showing assigned sections and grading access.
     """
-    from enrollment.models import Section
-
-    sections = Section.objects.filter(professor=request.user).select_related('subject', 'term')
+    sections = list(
+        Section.objects.filter(professors=request.user)
+        .select_related('term')
+        .only('section_code', 'status', 'capacity', 'term__name')
+        .prefetch_related(Prefetch('subjects', queryset=Subject.objects.only('code', 'title', 'units')))
+    )
 
     context = {
         'assigned_sections': sections,
-        'total_sections': sections.count(),
+        'total_sections': len(sections),
     }
     return render(request, 'dashboards/professor_dashboard.html', context)
 
@@ -142,45 +200,52 @@ def student_dashboard(request):
     Student dashboard with enrollment and grade viewer.
     Shows enrollment eligibility based on past term completion and grade posting.
     """
-    from enrollment.models import Student, StudentSubject, Enrollment, Term
-    from enrollment.student_enrollment_views import can_student_enroll
-
-    try:
-        student = Student.objects.get(user=request.user)
-        enrolled_subjects = StudentSubject.objects.filter(student=student).select_related('subject', 'term', 'section')
-
-        # Check enrollment eligibility with comprehensive checks
-        active_term = Term.objects.filter(is_active=True, archived=False, level=student.program.level).first()
-
-        can_enroll = False
-        enrollment_status = None
-        enrollment_message = None
-        enrollment_details = {}
-
-        if active_term:
-            can_enroll, enrollment_message, enrollment_details = can_student_enroll(student, active_term)
-
-        context = {
-            'student': student,
-            'enrolled_subjects': enrolled_subjects,
-            'total_units': sum([ss.subject.units for ss in enrolled_subjects if ss.status == 'enrolled']),
-            'has_active_enrollment': not can_enroll and enrollment_details.get('reason') == 'already_enrolled',
-            'can_enroll': can_enroll,
-            'enrollment_message': enrollment_message,
-            'enrollment_details': enrollment_details,
-            'active_term': active_term,
-        }
-    except Student.DoesNotExist:
-        context = {
-            'student': None,
-            'enrolled_subjects': [],
-            'total_units': 0,
-            'has_active_enrollment': False,
-            'can_enroll': False,
-            'enrollment_message': None,
-            'enrollment_details': {},
-            'active_term': None,
-        }
+    # Load the profile, its user/program/curriculum and the enrolled subjects
+    # up front; the template's {% if %} and {% for %} share the prefetched list
+    student = Student.objects.select_related('user', 'program', 'curriculum').prefetch_related(
+        Prefetch(
+            'studentsubject_set',
+            queryset=StudentSubject.objects.select_related(
+                'subject', 'term', 'section', 'professor'
+            ).only(
+                # student is the prefetch join key; the rest is what the table renders
+                'student', 'status',
+                'subject__code', 'subject__title', 'subject__units',
+                'term__name', 'section__section_code',
+                'professor__username', 'professor__first_name', 'professor__last_name',
+            ),
+            to_attr='enrolled_subjects_cached',
+        )
+    ).filter(user=request.user).first()
+
+    if student is None:
+        return render(request, 'dashboards/student_dashboard.html', _EMPTY_STUDENT_CONTEXT.copy())
+
+    total_units = StudentSubject.objects.filter(
+        student=student, status='enrolled'
+    ).aggregate(total=Sum('subject__units'))['total'] or 0
+
+    # Check enrollment eligibility with comprehensive checks
+    active_term_id = get_active_term_id(student.program.level)
+    active_term = Term.objects.filter(pk=active_term_id).first() if active_term_id else None
+
+    can_enroll = False
+    enrollment_message = None
+    enrollment_details = {}
+
+    if active_term:
+        can_enroll, enrollment_message, enrollment_details = can_student_enroll(student, active_term)
+
+    context = {
+        'student': student,
+        'enrolled_subjects': student.enrolled_subjects_cached,
+        'total_units': total_units,
+        'has_active_enrollment': not can_enroll and enrollment_details.get('reason') == 'already_enrolled',
+        'can_enroll': can_enroll,
+        'enrollment_message': enrollment_message,
+        'enrollment_details': enrollment_details,
+        'active_term': active_term,
+    }
 
     return render(request, 'dashboards/student_dashboard.html', context)
 
@@ -190,37 +255,34 @@ def admission_dashboard(request):
     """
     Admission dashboard for managing new applicants and transferee enrollment.
     """
-    from enrollment.models import Student, TransfereeEnrollment
-
-    recent_students = Student.objects.all().order_by('-created_at')[:20]
-
-    # Transferee statistics
-    pending_transferees = TransfereeEnrollment.objects.exclude(
-        status__in=['rejected', 'account_created']
-    ).count()
+    # Read-only table rows, so plain dicts instead of model instances
+    recent_students = list(
+        Student.objects.order_by('-created_at').values(
+            'status', 'created_at',
+            username=F('user__username'),
+            full_name=Trim(Concat('user__first_name', Value(' '), 'user__last_name')),
+            program_name=F('program__name'),
+            curriculum_version=F('curriculum__version'),
+        )[:20]
+    )
 
     context = {
+        **get_admission_stats(),
         'recent_students': recent_students,
-        'total_students': Student.objects.count(),
-        'active_students': Student.objects.filter(status='active').count(),
-        'pending_transferees': pending_transferees,
     }
     return render(request, 'dashboards/admission_dashboard.html', context)
 
 
 @role_required('dean')
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=_dashboard_etag(get_dean_stats, _program_rows))
 def dean_dashboard(request):
     """
     Dean dashboard with academic analytics and oversight.
     """
-    from enrollment.models import Student, Section
-    from academics.models import Program
-
     context = {
-        'total_students': Student.objects.count(),
-        'active_students': Student.objects.filter(status='active').count(),
-        'total_sections': Section.objects.count(),
-        'programs': Program.objects.all(),
+        **get_dean_stats(),
+        'programs': get_all_programs(),
     }
     return render(request, 'dashboards/dean_dashboard.html', context)
 
@@ -231,9 +293,6 @@ def student_account_settings(request):
     """
     Student account settings page - allows students to edit username and password.
     """
-    from django.contrib.auth import update_session_auth_hash
-    from audit.models import AuditTrail
-
     user = request.user
 
     if request.method == 'POST':
@@ -256,12 +315,9 @@ def student_account_settings(request):
             if len(new_username) > 150:
                 errors.append('Username cannot exceed 150 characters.')
 
-            # Check if username already exists
-            if new_username != user.username and User.objects.filter(username=new_username).exists():
-                errors.append('This username is already taken.')
-
-            # Verify password
-            if not user.check_password(confirm_password):
+            # Verify password last; the hash is only worth running once the
+            # cheap checks pass
+            if not errors and not user.check_password(confirm_password):
                 errors.append('Incorrect password. Username change cancelled.')
 
             if errors:
@@ -272,13 +328,24 @@ def student_account_settings(request):
                 }
                 return render(request, 'account_settings.html', context)
 
-            # Change username
+            # Change username; the unique constraint on username rejects a
+            # taken name, so there is no separate lookup beforehand
             old_username = user.username
             user.username = new_username
-            user.save()
+            try:
+                with transaction.atomic():
+                    user.save(update_fields=['username'])
+            except IntegrityError:
+                user.username = old_username
+                context = {
+                    'user': user,
+                    'errors': ['This username is already taken.'],
+                    'action': 'change_username',
+                }
+                return render(request, 'account_settings.html', context)
 
             # Audit trail
-            AuditTrail.objects.create(
+            record_audit(
                 actor=user,
                 action='change_username',
                 entity='User',
@@ -301,18 +368,23 @@ def student_account_settings(request):
             # Validation
             errors = []
 
-            if not user.check_password(current_password):
-                errors.append('Current password is incorrect.')
-
-            if len(new_password) < 8:
-                errors.append('New password must be at least 8 characters long.')
-
             if new_password != confirm_password:
                 errors.append('New passwords do not match.')
 
             if new_password == current_password:
                 errors.append('New password must be different from current password.')
 
+            # Length, similarity, common and numeric checks from AUTH_PASSWORD_VALIDATORS
+            try:
+                validate_password(new_password, user=user)
+            except ValidationError as e:
+                errors.extend(e.messages)
+
+            # Verify the current password last; the hash is only worth running
+            # once the cheap checks pass
+            if not errors and not user.check_password(current_password):
+                errors.append('Current password is incorrect.')
+
             if errors:
                 context = {
                     'user': user,
@@ -326,7 +398,7 @@ def student_account_settings(request):
             user.save()
 
             # Audit trail
-            AuditTrail.objects.create(
+            record_audit(
                 actor=user,
                 action='change_password',
                 entity='User',